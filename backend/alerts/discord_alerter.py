@@ -7,11 +7,21 @@ Supports DISCORD_ODTE_LEVELS webhook
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Dict, Optional
+import json
 import logging
 import os
 
+# orjson (optional) serializes webhook payloads much faster than the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class DiscordAlerter:
     def __init__(self, webhook_url: str = None, config: dict = None):
@@ -20,6 +30,20 @@ class DiscordAlerter:
         
         self.webhooks = {}
         
+        # One keep-alive session shared by every channel, so alerts skip the TLS handshake
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset({'POST'}),
+                respect_retry_after_header=False  # Discord sends fractional Retry-After values
+            )
+        ))
+        
         if config:
             self.webhooks = {
                 'trading': self._expand_env_var(config.get('webhook_trading')),
@@ -86,6 +110,16 @@ class DiscordAlerter:
         
         return value
     
+    @staticmethod
+    def _encode_payload(payload: Dict) -> bytes:
+        """Serialize a webhook payload to JSON bytes"""
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass  # Types orjson rejects (e.g. ints beyond 64 bits) - use the json module
+        return json.dumps(payload).encode('utf-8')
+    
     def _send_webhook(self, channel: str, payload: Dict) -> bool:
         """Send webhook to specific channel"""
         webhook_url = self.webhooks.get(channel)
@@ -94,7 +128,12 @@ class DiscordAlerter:
             return False
         
         try:
-            response = requests.post(webhook_url, json=payload, timeout=10)
+            response = self.http.post(
+                webhook_url,
+                data=self._encode_payload(payload),
+                headers={'Content-Type': 'application/json'},
+                timeout=10
+            )
             response.raise_for_status()
             self.logger.info(f"✅ Sent alert to Discord #{channel}")
             return True
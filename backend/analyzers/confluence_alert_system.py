@@ -14,6 +14,8 @@ Optimized for 6-7 figure day trader - don't miss setups
 """
 
 import logging
+import threading
+import time
 from typing import Dict, List, Optional
 from datetime import datetime, date
 
@@ -39,8 +41,9 @@ class ConfluenceAlertSystem:
             'pin_probability': 15    # 0DTE pin effect
         }
         
-        # Cooldown tracking (prevent spam)
-        self.alerts_sent_today = {}  # {symbol: {alert_type: timestamp}}
+        # Cooldown tracking (prevent spam); locked since monitors check symbols from worker threads
+        self.alerts_sent_today = {}  # {symbol: {alert_type: {'date', 'time' (time.monotonic())}}}
+        self._cooldown_lock = threading.Lock()
         self.cooldown_minutes = {
             'CONFLUENCE_BUY': 15,
             'CONFLUENCE_SELL': 15,
@@ -407,20 +410,18 @@ class ConfluenceAlertSystem:
         try:
             today = date.today().isoformat()
             
-            if symbol not in self.alerts_sent_today:
-                self.alerts_sent_today[symbol] = {}
+            with self._cooldown_lock:
+                last_alert = self.alerts_sent_today.get(symbol, {}).get(alert_type)
             
-            if alert_type not in self.alerts_sent_today[symbol]:
+            if last_alert is None:
                 return True
             
-            last_alert = self.alerts_sent_today[symbol][alert_type]
-            
             # Check if same day
             if last_alert['date'] != today:
                 return True
             
             # Check cooldown
-            elapsed = (datetime.now() - last_alert['time']).total_seconds() / 60
+            elapsed = (time.monotonic() - last_alert['time']) / 60
             cooldown = self.cooldown_minutes.get(alert_type, 15)
             
             return elapsed >= cooldown
@@ -432,13 +433,11 @@ class ConfluenceAlertSystem:
         """Mark alert as sent"""
         today = date.today().isoformat()
         
-        if symbol not in self.alerts_sent_today:
-            self.alerts_sent_today[symbol] = {}
-        
-        self.alerts_sent_today[symbol][alert_type] = {
-            'date': today,
-            'time': datetime.now()
-        }
+        with self._cooldown_lock:
+            self.alerts_sent_today.setdefault(symbol, {})[alert_type] = {
+                'date': today,
+                'time': time.monotonic()
+            }
 
 
 # Testing
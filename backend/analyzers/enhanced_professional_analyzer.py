@@ -13,12 +13,16 @@ backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 import logging
+import threading
+import time
 from collections import defaultdict
+from contextlib import contextmanager
 import pytz
 
 # Import GEX Calculator
@@ -79,6 +83,18 @@ class EnhancedProfessionalAnalyzer:
         self.base_url = "https://api.polygon.io"
         self.logger = logging.getLogger(__name__)
         
+        # Keep-alive Polygon session, sized for monitors scanning symbols from a thread pool.
+        # Monitors share one analyzer (get_shared_analyzer), so in-flight requests are
+        # capped at the pool size across all of their scan pools
+        self.max_concurrent_requests = 16
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=self.max_concurrent_requests))
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrent_requests)
+        
+        # Per-thread time budget for Polygon requests (see request_deadline)
+        self.request_timeout = 10
+        self._deadline = threading.local()
+        
         # ThetaData API setup (PRIMARY - Optimized v3)
         try:
             self.thetadata_client = ThetaDataClientV3(cache_seconds=60)
@@ -199,16 +215,56 @@ class EnhancedProfessionalAnalyzer:
         params['apiKey'] = self.polygon_api_key
         url = f"{self.base_url}{endpoint}"
         
+        # Inside request_deadline, each request only gets what is left of the budget
+        timeout = self.request_timeout
+        deadline = getattr(self._deadline, 'at', None)
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                self.logger.warning(f"Skipping {endpoint}: request budget exhausted")
+                return {}
+        
+        # Wait for a free connection slot (within the budget, if there is one)
+        started = time.monotonic()
+        if not self._request_slots.acquire(timeout=timeout if deadline is not None else None):
+            self.logger.warning(f"Skipping {endpoint}: request budget exhausted waiting for a connection")
+            return {}
+        
         try:
-            response = requests.get(url, params=params, timeout=10)
+            if deadline is not None:
+                timeout -= time.monotonic() - started
+                if timeout <= 0:
+                    self.logger.warning(f"Skipping {endpoint}: request budget exhausted")
+                    return {}
+            response = self.session.get(url, params=params, timeout=timeout)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API request failed for {endpoint}: {str(e)}")
             return {}
+        finally:
+            self._request_slots.release()
     
  
 
+    @contextmanager
+    def request_deadline(self, seconds: float):
+        """Bound all Polygon requests this thread makes inside the block to one shared budget"""
+        self._deadline.at = time.monotonic() + seconds
+        try:
+            yield
+        finally:
+            self._deadline.at = None
+    
+    def deadline_exceeded(self) -> bool:
+        """True if this thread's request_deadline budget has run out"""
+        deadline = getattr(self._deadline, 'at', None)
+        return deadline is not None and time.monotonic() >= deadline
+    
+    def close(self):
+        """Release pooled Polygon connections"""
+        self.session.close()
+    
     def get_options_chain(self, symbol: str, current_price: float = None) -> List[Dict]:
         """
         Get options chain using ThetaData v3 with IV-based filtering
@@ -990,6 +1046,21 @@ class EnhancedProfessionalAnalyzer:
             }
         return {'price': 0, 'size': 0, 'timestamp': 0}
     
+    def get_snapshot_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Last trade prices for many symbols from one snapshot request (symbols without a trade are omitted)"""
+        if not symbols:
+            return {}
+        
+        endpoint = "/v2/snapshot/locale/us/markets/stocks/tickers"
+        data = self._make_request(endpoint, {'tickers': ','.join(symbols)})
+        
+        prices = {}
+        for ticker in data.get('tickers') or []:
+            price = (ticker.get('lastTrade') or {}).get('p', 0)
+            if price:
+                prices[ticker.get('ticker')] = price
+        return prices
+    
     def get_support_resistance(self, symbol: str, current_price: float, lookback_days: int = 10) -> Dict:
         """Calculate support/resistance"""
         end_date = datetime.now().strftime('%Y-%m-%d')
@@ -1890,6 +1961,46 @@ class EnhancedProfessionalAnalyzer:
             return {'symbol': symbol, 'error': str(e), 'signal': None}
 
 
+# One analyzer per credential set, shared by the monitors in this process so they
+# reuse its Polygon connection pool and caches instead of each opening their own.
+# Values are [analyzer, holders]; the last release_shared_analyzer closes it
+_SHARED_ANALYZERS: Dict[tuple, list] = {}
+_SHARED_ANALYZERS_LOCK = threading.Lock()
+
+
+def get_shared_analyzer(polygon_api_key: str,
+                        tradier_api_key: Optional[str] = None,
+                        tradier_account_type: str = 'sandbox') -> EnhancedProfessionalAnalyzer:
+    """Process-wide EnhancedProfessionalAnalyzer for these credentials (pair with release_shared_analyzer)"""
+    key = (polygon_api_key, tradier_api_key, tradier_account_type)
+    with _SHARED_ANALYZERS_LOCK:
+        entry = _SHARED_ANALYZERS.get(key)
+        if entry is None:
+            entry = _SHARED_ANALYZERS[key] = [
+                EnhancedProfessionalAnalyzer(
+                    polygon_api_key=polygon_api_key,
+                    tradier_api_key=tradier_api_key,
+                    tradier_account_type=tradier_account_type,
+                    debug_mode=False
+                ),
+                0
+            ]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_shared_analyzer(analyzer: EnhancedProfessionalAnalyzer):
+    """Drop one holder of a shared analyzer, closing its session when none remain"""
+    with _SHARED_ANALYZERS_LOCK:
+        for key, entry in _SHARED_ANALYZERS.items():
+            if entry[0] is analyzer:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del _SHARED_ANALYZERS[key]
+                    analyzer.close()
+                return
+
+
 if __name__ == '__main__':
     import os
     from dotenv import load_dotenv
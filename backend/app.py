@@ -1442,4 +1442,9 @@ if __name__ == '__main__':
     print("=" * 60 + "\n")
     
     # Start Flask server
-    app.run(host='0.0.0.0', port=5001, debug=False)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5001, debug=False)
+    
+    # Server stopped: release monitor pools; the analyzer they share closes with the last one
+    for monitor in (momentum_monitor, odte_monitor):
+        if monitor:
+            monitor.shutdown()
\ No newline at end of file
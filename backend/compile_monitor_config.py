@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+backend/compile_monitor_config.py
+Compile config.yaml + .env into monitors/_compiled_config.py
+
+The generated module is a plain Python literal, so the interpreter's
+bytecode cache makes loading it on restart nearly free (no YAML or dotenv
+parsing). It records the mtimes of config.yaml and .env; monitors fall back
+to the sources (with a warning) once either is newer. Re-run after editing
+config.yaml or .env. The output holds secrets and is created mode 0600.
+
+Usage: python compile_monitor_config.py
+"""
+
+import os
+import re
+import logging
+import pprint
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+from dotenv import find_dotenv, load_dotenv
+
+backend_dir = Path(__file__).parent
+config_path = backend_dir / 'config' / 'config.yaml'
+output_path = backend_dir / 'monitors' / '_compiled_config.py'
+
+# Environment values the monitors read directly
+ENV_KEYS = ('POLYGON_API_KEY', 'DISCORD_NEWS_ALERTS', 'DISCORD_MOMENTUM_SIGNALS')
+
+
+def expand_env_vars(value):
+    """Recursively replace ${VAR_NAME} with its environment value"""
+    if isinstance(value, dict):
+        return {key: expand_env_vars(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [expand_env_vars(item) for item in value]
+    elif isinstance(value, str):
+        return re.sub(
+            r'\$\{([^}]+)\}',
+            lambda match: os.getenv(match.group(1), match.group(0)),
+            value
+        )
+    return value
+
+
+def load_compiled_config(logger: logging.Logger = None):
+    """(CONFIG, ENV) from the compiled module, or None if it's missing or older than its sources"""
+    logger = logger or logging.getLogger(__name__)
+    
+    try:
+        from monitors._compiled_config import CONFIG, ENV, SOURCES
+    except ImportError:
+        logger.info("ℹ️ No compiled monitor config, loading config.yaml and .env")
+        return None
+    
+    stale = [
+        path for path, mtime in SOURCES.items()
+        if not os.path.exists(path) or os.path.getmtime(path) > mtime
+    ]
+    if stale:
+        logger.warning(
+            f"⚠️ Compiled monitor config is older than {', '.join(stale)} - loading "
+            f"config.yaml and .env instead (re-run compile_monitor_config.py)"
+        )
+        return None
+    
+    logger.info(f"⚡ Loaded compiled monitor config from {output_path}")
+    return CONFIG, ENV
+
+
+def main():
+    dotenv_path = find_dotenv()
+    load_dotenv(dotenv_path)
+    
+    with open(config_path, 'r') as f:
+        config = expand_env_vars(yaml.safe_load(f) or {})
+    
+    env = {key: os.getenv(key) for key in ENV_KEYS if os.getenv(key)}
+    
+    # Source mtimes, so loaders can tell when this snapshot has gone stale
+    sources = {str(config_path.resolve()): config_path.stat().st_mtime}
+    if dotenv_path:
+        sources[os.path.abspath(dotenv_path)] = os.path.getmtime(dotenv_path)
+    
+    source = (
+        '"""\n'
+        'backend/monitors/_compiled_config.py\n'
+        f'GENERATED by compile_monitor_config.py on {datetime.now():%Y-%m-%d %H:%M:%S}\n'
+        'Contains resolved secrets - do not edit or commit\n'
+        '"""\n\n'
+        f'CONFIG = {pprint.pformat(config, sort_dicts=False)}\n\n'
+        f'ENV = {pprint.pformat(env, sort_dicts=False)}\n\n'
+        f'SOURCES = {pprint.pformat(sources, sort_dicts=False)}\n'
+    )
+    
+    # Owner-only from creation (it holds the Polygon key and webhook URLs),
+    # swapped in atomically so a running monitor never imports a partial file
+    tmp_path = output_path.with_suffix('.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(source)
+    os.chmod(tmp_path, 0o600)
+    os.replace(tmp_path, output_path)
+    print(f"✅ Compiled {config_path} -> {output_path}")
+
+
+if __name__ == '__main__':
+    main()
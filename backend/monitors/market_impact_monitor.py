@@ -12,18 +12,78 @@ from pathlib import Path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
+import os
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import time
+import queue
+import threading
+import yaml
+import sqlite3
+import numpy as np
 import hashlib
+import bisect
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
-from collections import defaultdict
+from typing import Dict, List, Optional
+from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from analyzers.volume_analyzer import VolumeAnalyzer
+from utils.cache_manager import CacheManager
+from utils.market_hours_utils import is_market_hours
+
+# Aho-Corasick keyword automaton (pip install pyahocorasick)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Keywords match whole words, allowing simple inflections ('upgrade' -> 'upgraded')
+KEYWORD_SUFFIX = r'(?:s|es|d|ed)?(?!\w)'
+_keyword_suffix_re = re.compile(KEYWORD_SUFFIX)
+
+# Fast non-cryptographic hashing for news dedup (pip install xxhash)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+@dataclass(slots=True)
+class MarketImpactStats:
+    """Monitor counters (slot attributes; Flask's jsonify serializes dataclasses)"""
+    macro_events: int = 0
+    analyst_events: int = 0
+    ma_events: int = 0
+    earnings_events: int = 0
+    spillover_events: int = 0
+    volume_confirmed: int = 0
+    alerts_sent: int = 0
+    filtered: int = 0
 
 
 class MarketImpactMonitor:
+    # print_stats rows: (label, MarketImpactStats field)
+    STATS_LABELS = (
+        ('Macro Events', 'macro_events'),
+        ('Analyst Events', 'analyst_events'),
+        ('M&A Events', 'ma_events'),
+        ('Earnings Events', 'earnings_events'),
+        ('Spillover Events', 'spillover_events'),
+        ('Volume Confirmed', 'volume_confirmed'),
+        ('Alerts Sent', 'alerts_sent'),
+        ('Filtered (low impact)', 'filtered'),
+    )
+    
+    # Back-to-back burst scans allowed before returning to scheduled polls
+    MAX_BURST_SCANS = 120
+    
     def __init__(self, polygon_api_key: str, config: Dict, watchlist_manager=None):
         """
         Initialize Market Impact Monitor
@@ -37,10 +97,30 @@ class MarketImpactMonitor:
         self.api_key = polygon_api_key
         self.base_url = "https://api.polygon.io"
         
+        # Bound on concurrent outbound requests (volume fan-out + Polygon)
+        self.max_concurrent_requests = config.get('market_impact_monitor', {}).get('max_concurrent_requests', 16)
+        
+        # Pooled keep-alive connections shared by Polygon and Discord calls;
+        # sized so every pool worker plus the Discord worker gets a connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_concurrent_requests + 1,
+            pool_maxsize=self.max_concurrent_requests + 1,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504)
+            )
+        )
+        self.session.mount('https://', adapter)
+        
         # Configuration
         self.config = config.get('market_impact_monitor', {})
         self.enabled = self.config.get('enabled', True)
         self.check_interval = self.config.get('check_interval', 30)
+        self.poll_budget_per_hour = self.config.get(
+            'poll_budget_per_hour', max(1, int(3600 / self.check_interval))
+        )
         self.lookback_hours = self.config.get('lookback_hours', 1)
         self.max_alerts_per_hour = self.config.get('max_alerts_per_hour', 20)
         
@@ -81,6 +161,15 @@ class MarketImpactMonitor:
             'revenue beat', 'guidance raised', 'guidance lowered'
         ])
         
+        # Event categories in priority order: (type, priority, stats key, keywords)
+        self.event_categories = [
+            ('MACRO', 'CRITICAL', 'macro_events', self.macro_keywords),
+            ('M&A', 'HIGH', 'ma_events', self.ma_keywords),
+            ('ANALYST', 'HIGH', 'analyst_events', self.analyst_keywords),
+            ('EARNINGS', 'HIGH', 'earnings_events', self.earnings_keywords)
+        ]
+        self._build_keyword_matchers()
+        
         # Spillover mapping (NVDA -> related stocks)
         self.spillover_map = self.config.get('spillover_map', {
             'NVDA': ['NVTS', 'SMCI', 'ARM', 'AMD', 'AVGO', 'TSM', 'INTC', 'MU', 'MRVL'],
@@ -94,13 +183,34 @@ class MarketImpactMonitor:
             'META': ['SNAP', 'PINS', 'RBLX']
         })
         
+        # Reverse index (SMCI -> ['NVDA']) and primary key set, built once
+        self._spillover_keys = frozenset(self.spillover_map)
+        self._reverse_spillover = defaultdict(list)
+        for primary, related in self.spillover_map.items():
+            for related_ticker in related:
+                self._reverse_spillover[related_ticker].append(primary)
+        
         # Volume confirmation
         self.volume_enabled = self.config.get('volume_confirmation', {}).get('enabled', True)
-        self.min_rvol = self.config.get('volume_confirmation', {}).get('min_rvol', 1.5)
-        self.critical_rvol = self.config.get('volume_confirmation', {}).get('critical_rvol', 2.0)
         
-        # Initialize volume analyzer
+        # Runtime-tunable thresholds (swapped as a whole by set_thresholds)
+        self.config_path = backend_dir / 'config' / 'config.yaml'
+        self._thresholds_lock = threading.Lock()
+        self._thresholds = {
+            'min_rvol': self.config.get('volume_confirmation', {}).get('min_rvol', 1.5),
+            'critical_rvol': self.config.get('volume_confirmation', {}).get('critical_rvol', 2.0),
+            'min_impact_score': self.config.get('min_impact_score', 4.0)
+        }
+        
+        # Initialize volume analyzer (lookups fan out over a thread pool)
         self.volume_analyzer = None
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_requests,
+            thread_name_prefix='MarketImpactIO'
+        )
+        
+        # Volume results are reused across articles and nearby cycles
+        self._vol_cache = CacheManager(default_ttl=self.config.get('volume_cache_ttl', 60))
         if self.volume_enabled:
             try:
                 self.volume_analyzer = VolumeAnalyzer(polygon_api_key)
@@ -109,29 +219,63 @@ class MarketImpactMonitor:
                 self.logger.error(f"⚠️ Volume analyzer failed: {str(e)}")
         
         # Alert tracking
-        self.seen_news_hashes: Set[str] = set()
-        self.alert_counts = defaultdict(int)
-        self.last_alert_reset = datetime.now()
+        # Seen articles, bounded LRU so a long-running monitor stays flat in memory
+        self.seen_news_hashes: OrderedDict = OrderedDict()
+        self.max_seen_hashes = self.config.get('max_seen_hashes', 50000)
+        
+        # Alert arrival history (epoch seconds) used to place polls; persisted
+        # alongside the seen hashes so the learned schedule survives restarts
+        self.arrival_history = deque(self.config.get('arrival_history', []), maxlen=1000)
+        
+        # Seen articles are persisted so a restart doesn't re-alert the lookback window
+        self.seen_db_path = self.config.get(
+            'seen_hashes_db', str(backend_dir / 'data' / 'market_impact_seen.db')
+        )
+        self.seen_retention_hours = self.config.get('seen_retention_hours', 24)
+        self._seen_db = None
+        # One connection shared by the poll loop and the Discord worker (via the
+        # hourly prune); sqlite3 leaves serializing its use to the caller
+        self._seen_db_lock = threading.Lock()
+        self._load_seen_hashes()
+        
+        # Alert accounting is updated by the Discord worker after each post and read
+        # by the poll loop; alert_counts, _alert_bucket, stats.alerts_sent and
+        # arrival_history are only touched under _alert_lock
+        self._alert_lock = threading.Lock()
+        self.alert_counts = defaultdict(int)  # keyed by monotonic hour bucket
+        self._alert_bucket = int(time.monotonic() // 3600)
+        self.poll_schedule: List[float] = []
+        
+        # Adaptive polling: shrink interval while news bursts, widen when quiet
+        self.min_poll_interval = self.config.get('min_impact_poll_ms', 5000) / 1000
+        self.max_poll_interval = self.config.get('max_impact_poll_ms', self.check_interval * 1000) / 1000
+        self.burst_interval: Optional[float] = None
+        self.burst_scans = 0
+        
+        # Quiet-period backoff: skip scheduled polls while checks come back empty
+        self.max_backoff = self.config.get('max_backoff_seconds', 600)
+        self.consecutive_empty = 0
         
         # Thresholds
         self.min_price_target_change = self.config.get('min_price_target_change_percent', 20)
         self.min_earnings_surprise = self.config.get('min_earnings_surprise_percent', 10)
-        self.min_impact_score = self.config.get('min_impact_score', 4.0)
         
-        # Discord webhook
+        # Discord webhook (posts are drained by a background worker)
         self.discord_webhook = None
+        self._discord_queue = queue.Queue()
+        self._discord_thread = None
+        self.flush_interval_ms = self.config.get('flush_interval_ms', 500)
+        
+        # Kernel timer for poll deadlines (Python 3.13+ on Linux)
+        self._timer_fd = None
+        if hasattr(os, 'timerfd_create'):
+            try:
+                self._timer_fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+            except OSError as e:
+                self.logger.debug(f"timerfd unavailable, using sleep: {str(e)}")
         
         # Stats
-        self.stats = {
-            'macro_events': 0,
-            'analyst_events': 0,
-            'ma_events': 0,
-            'earnings_events': 0,
-            'spillover_events': 0,
-            'volume_confirmed': 0,
-            'alerts_sent': 0,
-            'filtered': 0
-        }
+        self.stats = MarketImpactStats()
         
         self.logger.info("✅ Market Impact Monitor initialized")
         self.logger.info(f"   Macro keywords: {len(self.macro_keywords)}")
@@ -139,161 +283,428 @@ class MarketImpactMonitor:
         self.logger.info(f"   Spillover maps: {len(self.spillover_map)}")
         self.logger.info(f"   Min RVOL: {self.min_rvol}x")
     
+    @property
+    def min_rvol(self) -> float:
+        return self._thresholds['min_rvol']
+    
+    @property
+    def critical_rvol(self) -> float:
+        return self._thresholds['critical_rvol']
+    
+    @property
+    def min_impact_score(self) -> float:
+        return self._thresholds['min_impact_score']
+    
+    def set_thresholds(self, **kwargs):
+        """
+        Atomically replace alert thresholds without restarting
+        
+        Args:
+            min_rvol, critical_rvol, min_impact_score: New threshold values
+        """
+        unknown = set(kwargs) - set(self._thresholds)
+        if unknown:
+            raise ValueError(f"Unknown thresholds: {', '.join(sorted(unknown))}")
+        
+        with self._thresholds_lock:
+            thresholds = dict(self._thresholds)
+            thresholds.update({k: float(v) for k, v in kwargs.items()})
+            self._thresholds = thresholds
+        
+        self.logger.info(
+            f"🔧 Thresholds updated: impact>={thresholds['min_impact_score']} | "
+            f"RVOL>={thresholds['min_rvol']}x (critical {thresholds['critical_rvol']}x)"
+        )
+    
+    def reload_config(self):
+        """Re-read thresholds from config.yaml (environment is not reloaded)"""
+        try:
+            with open(self.config_path, 'r') as f:
+                config = yaml.safe_load(f) or {}
+            
+            monitor_config = config.get('market_impact_monitor', {})
+            volume_config = monitor_config.get('volume_confirmation', {})
+            
+            updates = {}
+            if 'min_impact_score' in monitor_config:
+                updates['min_impact_score'] = monitor_config['min_impact_score']
+            for key in ('min_rvol', 'critical_rvol'):
+                if key in volume_config:
+                    updates[key] = volume_config[key]
+            
+            self.set_thresholds(**updates)
+        except Exception as e:
+            self.logger.error(f"Error reloading config: {str(e)}")
+    
     def set_discord_webhook(self, webhook_url: str):
         """Set Discord webhook URL"""
         self.discord_webhook = webhook_url
         self.logger.info("✅ Discord webhook configured for market impact")
+        
+        if self._discord_thread is None:
+            self._discord_thread = threading.Thread(
+                target=self._discord_worker,
+                daemon=True,
+                name='MarketImpactDiscord'
+            )
+            self._discord_thread.start()
     
-    def _make_request(self, endpoint: str, params: dict = None, retries: int = 3) -> dict:
-        """Make Polygon API request with retry logic"""
+    def _discord_worker(self):
+        """Drain queued alerts in batches so webhook latency never delays the poll loop"""
+        while True:
+            batch = [self._discord_queue.get()]
+            deadline = time.monotonic() + self.flush_interval_ms / 1000
+            
+            # Collect up to Discord's 10-embed limit or until the flush interval
+            while len(batch) < 10:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._discord_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                self._post_alerts(batch)
+            finally:
+                for _ in batch:
+                    self._discord_queue.task_done()
+    
+    def drain_alerts(self):
+        """Block until every queued alert has been posted"""
+        self._discord_queue.join()
+    
+    def _make_request(self, endpoint: str, params: dict = None) -> dict:
+        """Make Polygon API request (retries are handled by the session adapter)"""
         if params is None:
             params = {}
         
         params['apiKey'] = self.api_key
         url = f"{self.base_url}{endpoint}"
         
-        for attempt in range(retries):
-            try:
-                response = requests.get(url, params=params, timeout=20)
-                response.raise_for_status()
-                return response.json()
-            except requests.exceptions.Timeout:
-                if attempt < retries - 1:
-                    self.logger.warning(f"Timeout, retrying ({attempt + 1}/{retries})...")
-                    time.sleep(2)
-                    continue
-                else:
-                    self.logger.error("API request timed out")
-                    return {}
-            except requests.exceptions.RequestException as e:
-                if attempt < retries - 1:
-                    self.logger.warning(f"API error, retrying: {str(e)}")
-                    time.sleep(2)
-                    continue
-                else:
-                    self.logger.error(f"API request failed: {str(e)}")
-                    return {}
+        try:
+            response = self.session.get(url, params=params, timeout=20)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.Timeout:
+            self.logger.error("API request timed out")
+            return {}
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"API request failed: {str(e)}")
+            return {}
+    
+    def _create_news_hash(self, title: str, published: str) -> int:
+        """Create unique 64-bit hash for news article"""
+        hash_bytes = f"{title}_{published}".encode()
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_intdigest(hash_bytes)
+        return int.from_bytes(hashlib.blake2b(hash_bytes, digest_size=8).digest(), 'big')
+    
+    def _build_keyword_matchers(self):
+        """Pre-lowercase keywords and compile one matcher over all categories"""
+        # keyword (lowercase) -> (category rank, original keyword); the
+        # highest-priority category wins for keywords listed twice
+        self._kw_to_type = {}
+        for rank, (_, _, _, keywords) in enumerate(self.event_categories):
+            for keyword in keywords:
+                self._kw_to_type.setdefault(keyword.lower(), (rank, keyword))
         
-        return {}
+        # Longest keywords first so the alternation prefers 'agrees to buy' over 'to buy';
+        # word boundaries keep 'Fed' from matching 'federated' or 'FedEx'
+        self._keyword_pattern = re.compile(
+            r'(?<!\w)(' + '|'.join(
+                re.escape(keyword) for keyword in sorted(self._kw_to_type, key=len, reverse=True)
+            ) + ')' + KEYWORD_SUFFIX,
+            re.IGNORECASE
+        )
+        
+        self._keyword_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for keyword_lower, (rank, keyword) in self._kw_to_type.items():
+                automaton.add_word(keyword_lower, (rank, keyword, len(keyword_lower)))
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
     
-    def _create_news_hash(self, title: str, published: str) -> str:
-        """Create unique hash for news article"""
-        hash_str = f"{title}_{published}"
-        return hashlib.md5(hash_str.encode()).hexdigest()
+    def get_spillover_sources(self, ticker: str) -> List[str]:
+        """Primary tickers that list ticker as a spillover (reverse of spillover_map)"""
+        return self._reverse_spillover.get(ticker, [])
     
-    def _check_keyword_match(self, text: str, keywords: List[str]) -> Optional[str]:
-        """Check if text contains any keywords, return matched keyword"""
-        text_lower = text.lower()
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                return keyword
-        return None
+    def _is_seen(self, news_hash: int) -> bool:
+        """Check whether an article was already alerted, refreshing its LRU slot"""
+        if news_hash in self.seen_news_hashes:
+            self.seen_news_hashes.move_to_end(news_hash)
+            return True
+        return False
+    
+    def _mark_seen(self, news_hash: int, persist: bool = True):
+        """Record an alerted article, evicting the least recently seen beyond the cap"""
+        self.seen_news_hashes[news_hash] = None
+        self.seen_news_hashes.move_to_end(news_hash)
+        while len(self.seen_news_hashes) > self.max_seen_hashes:
+            self.seen_news_hashes.popitem(last=False)
+        
+        if persist and self._seen_db is not None:
+            with self._seen_db_lock:
+                try:
+                    self._seen_db.execute(
+                        "INSERT OR REPLACE INTO seen_news (hash, ts) VALUES (?, ?)",
+                        (self._to_sqlite_int(news_hash), time.time())
+                    )
+                    self._seen_db.commit()
+                except sqlite3.Error as e:
+                    self.logger.error(f"Error persisting seen hash: {str(e)}")
+    
+    @staticmethod
+    def _to_sqlite_int(news_hash: int) -> int:
+        """Map an unsigned 64-bit hash onto SQLite's signed INTEGER range"""
+        return news_hash - (1 << 64) if news_hash >= (1 << 63) else news_hash
+    
+    @staticmethod
+    def _from_sqlite_int(value: int) -> int:
+        return value + (1 << 64) if value < 0 else value
+    
+    def _load_seen_hashes(self):
+        """Open the seen-hash store (SQLite WAL) and load hashes within the retention window"""
+        try:
+            Path(self.seen_db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.seen_db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_news (
+                    hash INTEGER PRIMARY KEY,
+                    ts REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE TABLE IF NOT EXISTS alert_arrivals (ts REAL NOT NULL)")
+            conn.commit()
+            self._seen_db = conn
+            
+            self._prune_seen_hashes()
+            with self._seen_db_lock:
+                rows = conn.execute("SELECT hash FROM seen_news ORDER BY ts").fetchall()
+                arrivals = conn.execute(
+                    "SELECT ts FROM (SELECT ts FROM alert_arrivals ORDER BY ts DESC LIMIT ?) ORDER BY ts",
+                    (self.arrival_history.maxlen,)
+                ).fetchall()
+            for (value,) in rows:
+                self._mark_seen(self._from_sqlite_int(value), persist=False)
+            self.arrival_history.extend(ts for (ts,) in arrivals)
+            
+            self.logger.info(
+                f"💾 Loaded {len(rows)} seen news hashes and {len(arrivals)} alert arrivals from {self.seen_db_path}"
+            )
+        except sqlite3.Error as e:
+            self.logger.error(f"⚠️ Seen-hash store unavailable, dedup is in-memory only: {str(e)}")
+            self._seen_db = None
+    
+    def _prune_seen_hashes(self):
+        """Delete persisted hashes older than the retention window and arrivals beyond the history cap"""
+        if self._seen_db is None:
+            return
+        with self._seen_db_lock:
+            try:
+                cutoff = time.time() - self.seen_retention_hours * 3600
+                self._seen_db.execute("DELETE FROM seen_news WHERE ts < ?", (cutoff,))
+                self._seen_db.execute(
+                    "DELETE FROM alert_arrivals WHERE ts < "
+                    "(SELECT ts FROM alert_arrivals ORDER BY ts DESC LIMIT 1 OFFSET ?)",
+                    (self.arrival_history.maxlen - 1,)
+                )
+                self._seen_db.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error pruning seen hashes: {str(e)}")
+    
+    @staticmethod
+    def _is_whole_word(text: str, start: int, end: int) -> bool:
+        """Check text[start:end] is not part of a larger word (same rule as the regex)"""
+        if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+            return False
+        return _keyword_suffix_re.match(text, end) is not None
+    
+    def _iter_keyword_hits(self, text_lower: str, start: int = 0):
+        """Yield (offset, category rank, keyword) for every whole-word keyword hit"""
+        if self._keyword_automaton is not None:
+            for end, (rank, keyword, length) in self._keyword_automaton.iter(text_lower, start):
+                hit_start = end - length + 1
+                if self._is_whole_word(text_lower, hit_start, end + 1):
+                    yield hit_start, rank, keyword
+        else:
+            for m in self._keyword_pattern.finditer(text_lower, start):
+                rank, keyword = self._kw_to_type[m.group(1)]
+                yield m.start(), rank, keyword
+    
+    def _classify_news_events(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Classify a batch of articles with one keyword scan
+        
+        Lowercased title+description texts are joined with a NUL separator
+        (never part of a keyword or a word) and scanned once; each hit is
+        mapped back to its article by offset, keeping the highest-priority
+        category per article.
+        """
+        texts = [f"{a.get('title', '')} {a.get('description', '')}".lower() for a in articles]
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+        batch_text = '\x00'.join(texts)
+        
+        best = [None] * len(texts)
+        
+        # Fast negative: most batches contain few keyword hits, often none
+        first = self._keyword_pattern.search(batch_text)
+        if first is not None:
+            for offset, rank, keyword in self._iter_keyword_hits(batch_text, first.start()):
+                index = bisect.bisect_right(offsets, offset) - 1
+                if best[index] is None or rank < best[index][0]:
+                    best[index] = (rank, keyword)
+        
+        classifications = []
+        rank_counts = [0] * len(self.event_categories)
+        for match in best:
+            classification = {
+                'type': 'GENERAL',
+                'priority': 'MEDIUM',
+                'matched_keyword': None,
+                'details': {}
+            }
+            
+            # Categories are ranked in priority order: MACRO > M&A > ANALYST > EARNINGS
+            if match:
+                rank, keyword = match
+                event_type, priority, _, _ = self.event_categories[rank]
+                classification['type'] = event_type
+                classification['priority'] = priority
+                classification['matched_keyword'] = keyword
+                rank_counts[rank] += 1
+            
+            classifications.append(classification)
+        
+        # Fold the per-batch tallies into the counters once
+        for (_, _, stats_key, _), count in zip(self.event_categories, rank_counts):
+            if count:
+                setattr(self.stats, stats_key, getattr(self.stats, stats_key) + count)
+        
+        return classifications
     
     def _classify_news_event(self, article: Dict) -> Dict:
         """Classify news event type and extract details"""
-        title = article.get('title', '')
-        description = article.get('description', '')
-        full_text = f"{title} {description}"
-        
-        classification = {
-            'type': 'GENERAL',
-            'priority': 'MEDIUM',
-            'matched_keyword': None,
-            'details': {}
-        }
+        return self._classify_news_events([article])[0]
+    
+    # Base impact score by event type
+    TYPE_SCORES = {
+        'MACRO': 9.0,
+        'M&A': 8.0,
+        'ANALYST': 7.0,
+        'EARNINGS': 7.5,
+        'GENERAL': 5.0
+    }
+    
+    # Embed color by priority
+    COLOR_MAP = {
+        'CRITICAL': 0xFF0000,  # Red
+        'HIGH': 0xFF6600,      # Orange
+        'MEDIUM': 0xFFCC00     # Yellow
+    }
+    
+    # Embed emoji by type
+    EMOJI_MAP = {
+        'MACRO': '🚨',
+        'M&A': '🤝',
+        'ANALYST': '📈',
+        'EARNINGS': '💰',
+        'GENERAL': 'ℹ️'
+    }
+    
+    # Action items by type (spillover movers override all but MACRO)
+    ACTION_TEXT = {
+        'MACRO': "✅ Check SPY/QQQ for market direction\n✅ Review watchlist for sector impact\n✅ Adjust position sizing",
+        'M&A': "✅ Check if target stock on watchlist\n✅ Review deal terms and timeline\n✅ Consider arbitrage opportunity",
+        'ANALYST': "✅ Review price target change magnitude\n✅ Check volume for validation\n✅ Look for entry on pullback"
+    }
+    SPILLOVER_ACTION_TEXT = "✅ Check {symbol} for continuation\n✅ Monitor related stocks for entry\n✅ Watch for momentum shifts"
+    DEFAULT_ACTION_TEXT = "✅ Review news details\n✅ Check Bookmap for confirmation\n✅ Monitor for follow-through"
+    
+    def _calculate_impact_scores(self,
+                                 event_types: List[str],
+                                 rvols: List[float],
+                                 spillover_counts: List[int]) -> np.ndarray:
+        """Calculate impact scores (0-10) for a batch of articles in one pass"""
+        base = np.fromiter(
+            (self.TYPE_SCORES.get(t, 5.0) for t in event_types),
+            dtype=np.float64, count=len(event_types)
+        )
+        rvol = np.asarray(rvols, dtype=np.float64)
+        spillover = np.asarray(spillover_counts, dtype=np.float64)
+        
+        # Volume boost
+        volume_boost = np.where(rvol >= self.critical_rvol, 1.0,
+                                np.where(rvol >= self.min_rvol, 0.5, 0.0))
         
-        # Check macro events (highest priority)
-        macro_match = self._check_keyword_match(full_text, self.macro_keywords)
-        if macro_match:
-            classification['type'] = 'MACRO'
-            classification['priority'] = 'CRITICAL'
-            classification['matched_keyword'] = macro_match
-            self.stats['macro_events'] += 1
-            return classification
-        
-        # Check M&A events
-        ma_match = self._check_keyword_match(full_text, self.ma_keywords)
-        if ma_match:
-            classification['type'] = 'M&A'
-            classification['priority'] = 'HIGH'
-            classification['matched_keyword'] = ma_match
-            self.stats['ma_events'] += 1
-            return classification
-        
-        # Check analyst events
-        analyst_match = self._check_keyword_match(full_text, self.analyst_keywords)
-        if analyst_match:
-            classification['type'] = 'ANALYST'
-            classification['priority'] = 'HIGH'
-            classification['matched_keyword'] = analyst_match
-            self.stats['analyst_events'] += 1
-            return classification
-        
-        # Check earnings events
-        earnings_match = self._check_keyword_match(full_text, self.earnings_keywords)
-        if earnings_match:
-            classification['type'] = 'EARNINGS'
-            classification['priority'] = 'HIGH'
-            classification['matched_keyword'] = earnings_match
-            self.stats['earnings_events'] += 1
-            return classification
-        
-        return classification
+        # Spillover boost
+        spillover_boost = np.minimum(spillover * 0.2, 1.0)
+        
+        return np.minimum(base + volume_boost + spillover_boost, 10.0)
     
     def _calculate_impact_score(self, 
                                 classification: Dict,
                                 volume_data: Optional[Dict] = None,
                                 spillover_count: int = 0) -> float:
         """Calculate impact score (0-10)"""
-        score = 0.0
-        
-        # Base score from event type
-        type_scores = {
-            'MACRO': 9.0,
-            'M&A': 8.0,
-            'ANALYST': 7.0,
-            'EARNINGS': 7.5,
-            'GENERAL': 5.0
-        }
-        
-        score = type_scores.get(classification['type'], 5.0)
+        rvol = volume_data.get('rvol', 0) if volume_data else 0
+        scores = self._calculate_impact_scores([classification['type']], [rvol], [spillover_count])
+        return float(scores[0])
+    
+    def _fetch_volume_data(self, tickers) -> Dict[str, Optional[Dict]]:
+        """Run volume spike checks concurrently, reusing results cached within the TTL"""
+        self._vol_cache.cleanup_expired()
         
-        # Volume boost
-        if volume_data:
-            rvol = volume_data.get('rvol', 0)
-            if rvol >= self.critical_rvol:
-                score += 1.0
-            elif rvol >= self.min_rvol:
-                score += 0.5
+        volume_data = {}
+        missing = []
+        for ticker in tickers:
+            cached = self._vol_cache.get(ticker)
+            if cached is not None:
+                volume_data[ticker] = cached
+            else:
+                missing.append(ticker)
         
-        # Spillover boost
-        if spillover_count > 0:
-            score += min(spillover_count * 0.2, 1.0)
+        results = self._io_pool.map(self.volume_analyzer.check_volume_spike, missing)
+        for ticker, result in zip(missing, results):
+            volume_data[ticker] = result
+            if result is not None:
+                self._vol_cache.set(ticker, result)
         
-        return min(score, 10.0)
+        return volume_data
+    
+    def _current_alert_bucket(self) -> int:
+        """Hourly rate-limit bucket from the monotonic clock, resetting counts on rollover (caller holds _alert_lock)"""
+        bucket = int(time.monotonic() // 3600)
+        if bucket != self._alert_bucket:
+            self.alert_counts.clear()
+            self._alert_bucket = bucket
+            self._prune_seen_hashes()
+        return bucket
     
     def check_for_market_impact_news(self) -> List[Dict]:
         """Check for high-impact news"""
         try:
             # Reset alert counter hourly
-            current_hour = datetime.now().hour
-            if (datetime.now() - self.last_alert_reset).total_seconds() > 3600:
-                self.alert_counts.clear()
-                self.last_alert_reset = datetime.now()
+            with self._alert_lock:
+                current_bucket = self._current_alert_bucket()
+                alerts_this_hour = self.alert_counts[current_bucket]
             
             # Check rate limit
-            if self.alert_counts[current_hour] >= self.max_alerts_per_hour:
-                self.logger.warning(f"Alert rate limit reached for hour {current_hour}")
+            if alerts_this_hour >= self.max_alerts_per_hour:
+                self.logger.warning(f"Alert rate limit reached ({self.max_alerts_per_hour}/hour)")
                 return []
             
-            # Build list of tickers to check
-            tickers_to_check = self.watchlist.copy() if self.watchlist else []
-            
-            # Add major spillover tickers
-            tickers_to_check.extend(self.spillover_map.keys())
-            
-            # Remove duplicates
-            tickers_to_check = list(set(tickers_to_check))
+            # Watchlist plus major spillover tickers, deduplicated in one pass
+            # (sorted so chunk composition is stable across polls)
+            tickers_to_check = sorted({*(self.watchlist or ()), *self.spillover_map})
             
             if not tickers_to_check:
                 self.logger.warning("No tickers to monitor")
@@ -301,42 +712,60 @@ class MarketImpactMonitor:
             
             # Get news for all tickers
             from_date = (datetime.now() - timedelta(hours=self.lookback_hours)).strftime('%Y-%m-%d')
-            to_date = datetime.now().strftime('%Y-%m-%d')
             
+            # API accepts 50 tickers per call - fetch every chunk concurrently
             endpoint = '/v2/reference/news'
-            params = {
-                'ticker': ','.join(tickers_to_check[:50]),  # API limit
-                'published_utc.gte': from_date,
-                'order': 'desc',
-                'limit': 100
-            }
+            params_list = [
+                {
+                    'ticker': ','.join(tickers_to_check[i:i + 50]),
+                    'published_utc.gte': from_date,
+                    'order': 'desc',
+                    'limit': 100
+                }
+                for i in range(0, len(tickers_to_check), 50)
+            ]
+            
+            responses = self._io_pool.map(
+                lambda params: self._make_request(endpoint, params),
+                params_list
+            )
             
-            response = self._make_request(endpoint, params)
+            # Merge chunks, dropping articles returned for several chunks
+            articles = []
+            seen_ids = set()
+            for response in responses:
+                for article in (response or {}).get('results', []):
+                    article_id = article.get('id') or article.get('article_url')
+                    if article_id:
+                        if article_id in seen_ids:
+                            continue
+                        seen_ids.add(article_id)
+                    articles.append(article)
             
-            if not response or 'results' not in response:
+            if not articles:
                 self.logger.warning("No news results from Polygon")
                 return []
             
-            articles = response['results']
-            self.logger.info(f"Found {len(articles)} news articles")
-            
-            # Filter and process
-            matched_articles = []
+            articles.sort(key=lambda a: a.get('published_utc', ''), reverse=True)
+            self.logger.info(f"Found {len(articles)} news articles ({len(params_list)} requests)")
             
+            # Drop seen articles, then classify the rest in one batch scan
+            unseen = []
             for article in articles:
                 news_hash = self._create_news_hash(
                     article.get('title', ''),
                     article.get('published_utc', '')
                 )
                 
-                if news_hash in self.seen_news_hashes:
-                    continue
-                
-                # Classify the event
-                classification = self._classify_news_event(article)
-                
+                if not self._is_seen(news_hash):
+                    unseen.append((article, news_hash))
+            
+            classifications = self._classify_news_events([article for article, _ in unseen])
+            
+            candidates = []
+            for (article, news_hash), classification in zip(unseen, classifications):
                 if classification['type'] == 'GENERAL':
-                    self.stats['filtered'] += 1
+                    self.stats.filtered += 1
                     continue
                 
                 # Get affected tickers
@@ -344,51 +773,80 @@ class MarketImpactMonitor:
                 if not tickers:
                     continue
                 
+                candidates.append((article, news_hash, classification, tickers))
+            
+            # Fetch volume for every primary/related ticker once, concurrently
+            volume_data = {}
+            if self.volume_analyzer and candidates:
+                volume_tickers = set()
+                for _, _, _, tickers in candidates:
+                    volume_tickers.update(tickers[:3])
+                    for ticker in self._spillover_keys.intersection(tickers):
+                        volume_tickers.update(self.spillover_map[ticker])
+                volume_data = self._fetch_volume_data(volume_tickers)
+            
+            # Gather per-article volume context, column-wise for batch scoring
+            spillover_column = []
+            confirmation_column = []
+            
+            for article, news_hash, classification, tickers in candidates:
                 # Check for spillover opportunities
                 spillover_opportunities = []
                 for ticker in tickers:
-                    if ticker in self.spillover_map:
+                    if ticker in self._spillover_keys:
                         related = self.spillover_map[ticker]
                         
                         # Check volume on related tickers
-                        if self.volume_analyzer:
-                            for related_ticker in related:
-                                vol_data = self.volume_analyzer.check_volume_spike(related_ticker)
-                                if vol_data and vol_data.get('rvol', 0) >= self.min_rvol:
-                                    spillover_opportunities.append({
-                                        'symbol': related_ticker,
-                                        'rvol': vol_data['rvol'],
-                                        'change_percent': vol_data.get('change_percent', 0),
-                                        'classification': vol_data.get('classification', 'Normal'),
-                                        'critical': vol_data.get('rvol', 0) >= self.critical_rvol
-                                    })
+                        for related_ticker in related:
+                            vol_data = volume_data.get(related_ticker)
+                            if vol_data and vol_data.get('rvol', 0) >= self.min_rvol:
+                                spillover_opportunities.append({
+                                    'symbol': related_ticker,
+                                    'rvol': vol_data['rvol'],
+                                    'change_percent': vol_data.get('change_percent', 0),
+                                    'classification': vol_data.get('classification', 'Normal'),
+                                    'critical': vol_data.get('rvol', 0) >= self.critical_rvol
+                                })
                         
                         if spillover_opportunities:
-                            self.stats['spillover_events'] += 1
+                            self.stats.spillover_events += 1
                 
                 # Get volume confirmation for primary tickers
                 volume_confirmations = {}
-                if self.volume_analyzer:
-                    for ticker in tickers[:3]:  # Check first 3 tickers
-                        vol_data = self.volume_analyzer.check_volume_spike(ticker)
-                        if vol_data and vol_data.get('rvol', 0) >= self.min_rvol:
-                            volume_confirmations[ticker] = vol_data
-                            self.stats['volume_confirmed'] += 1
+                for ticker in tickers[:3]:  # Check first 3 tickers
+                    vol_data = volume_data.get(ticker)
+                    if vol_data and vol_data.get('rvol', 0) >= self.min_rvol:
+                        volume_confirmations[ticker] = vol_data
                 
-                # Calculate impact score
-                impact_score = self._calculate_impact_score(
-                    classification,
-                    volume_data=list(volume_confirmations.values())[0] if volume_confirmations else None,
-                    spillover_count=len(spillover_opportunities)
-                )
+                if volume_confirmations:
+                    self.stats.volume_confirmed += 1
                 
-                # Filter by minimum impact score
-                if impact_score < self.min_impact_score:
-                    self.stats['filtered'] += 1
-                    continue
+                spillover_column.append(spillover_opportunities)
+                confirmation_column.append(volume_confirmations)
+            
+            if not candidates:
+                return []
+            
+            # Score every candidate at once and filter with a single mask
+            scores = self._calculate_impact_scores(
+                [classification['type'] for _, _, classification, _ in candidates],
+                [next(iter(c.values())).get('rvol', 0) if c else 0 for c in confirmation_column],
+                [len(opportunities) for opportunities in spillover_column]
+            )
+            keep = scores >= self.min_impact_score
+            self.stats.filtered += int(np.count_nonzero(~keep))
+            
+            # Filter and process
+            matched_articles = []
+            
+            for i in np.flatnonzero(keep):
+                article, news_hash, classification, tickers = candidates[i]
+                volume_confirmations = confirmation_column[i]
+                spillover_opportunities = spillover_column[i]
+                impact_score = float(scores[i])
                 
                 # Mark as seen
-                self.seen_news_hashes.add(news_hash)
+                self._mark_seen(news_hash)
                 
                 # Build alert data
                 alert_data = {
@@ -410,196 +868,229 @@ class MarketImpactMonitor:
             self.logger.debug(traceback.format_exc())
             return []
     
-    def send_discord_alert(self, alert_data: Dict) -> bool:
-        """Send market impact alert to Discord"""
-        if not self.discord_webhook:
-            self.logger.warning("Discord webhook not configured")
-            return False
+    def _build_embed(self, alert_data: Dict) -> Dict:
+        """Build the Discord embed for a market impact alert"""
+        article = alert_data['article']
+        classification = alert_data['classification']
+        tickers = alert_data['tickers']
+        volume_confirmations = alert_data['volume_confirmations']
+        spillover_opportunities = alert_data['spillover_opportunities']
+        impact_score = alert_data['impact_score']
         
-        try:
-            article = alert_data['article']
-            classification = alert_data['classification']
-            tickers = alert_data['tickers']
-            volume_confirmations = alert_data['volume_confirmations']
-            spillover_opportunities = alert_data['spillover_opportunities']
-            impact_score = alert_data['impact_score']
-            
-            event_type = classification['type']
-            priority = classification['priority']
-            matched_keyword = classification['matched_keyword']
-            
-            # Color by priority
-            color_map = {
-                'CRITICAL': 0xFF0000,  # Red
-                'HIGH': 0xFF6600,      # Orange
-                'MEDIUM': 0xFFCC00     # Yellow
-            }
-            
-            # Emoji by type
-            emoji_map = {
-                'MACRO': '🚨',
-                'M&A': '🤝',
-                'ANALYST': '📈',
-                'EARNINGS': '💰',
-                'GENERAL': 'ℹ️'
-            }
-            
-            # Build embed
-            title = f"{emoji_map.get(event_type, 'ℹ️')} {event_type} EVENT | Impact: {impact_score:.1f}/10"
-            
-            # Format tickers (bold first 3)
-            ticker_str = ', '.join([f"**{t}**" for t in tickers[:3]])
-            if len(tickers) > 3:
-                ticker_str += f" +{len(tickers) - 3} more"
-            
-            # Published time
-            published = article.get('published_utc', '')
-            time_str = published.split('T')[1][:5] if 'T' in published else 'N/A'
-            
-            embed = {
-                'title': title,
-                'description': f"**{article.get('title', 'No title')}**",
-                'color': color_map.get(priority, 0xFFCC00),
-                'fields': [],
-                'timestamp': datetime.utcnow().isoformat()
-            }
-            
+        event_type = classification['type']
+        priority = classification['priority']
+        matched_keyword = classification['matched_keyword']
+        
+        # Build embed
+        title = f"{self.EMOJI_MAP.get(event_type, 'ℹ️')} {event_type} EVENT | Impact: {impact_score:.1f}/10"
+        
+        # Format tickers (bold first 3)
+        ticker_str = ', '.join([f"**{t}**" for t in tickers[:3]])
+        if len(tickers) > 3:
+            ticker_str += f" +{len(tickers) - 3} more"
+        
+        # Published time
+        published = article.get('published_utc', '')
+        time_str = published.split('T')[1][:5] if 'T' in published else 'N/A'
+        
+        fields = [
             # Tickers field
-            embed['fields'].append({
-                'name': '🎯 Affected Tickers',
-                'value': ticker_str,
-                'inline': True
-            })
-            
+            {'name': '🎯 Affected Tickers', 'value': ticker_str, 'inline': True},
             # Priority & keyword
-            embed['fields'].append({
-                'name': '⚡ Priority',
-                'value': f"**{priority}** | {matched_keyword or 'N/A'}",
-                'inline': True
-            })
+            {'name': '⚡ Priority', 'value': f"**{priority}** | {matched_keyword or 'N/A'}", 'inline': True}
+        ]
+        
+        # Summary
+        summary = article.get('description', '')[:300]
+        if summary:
+            fields.append({'name': '📰 Summary', 'value': summary, 'inline': False})
+        
+        # Volume confirmations
+        if volume_confirmations:
+            vol_text = []
+            for ticker, vol_data in list(volume_confirmations.items())[:5]:
+                rvol = vol_data.get('rvol', 0)
+                classification_str = vol_data.get('classification', 'N/A')
+                emoji_str = '⚡⚡⚡' if rvol >= 3.0 else '⚡⚡' if rvol >= 2.5 else '⚡'
+                vol_text.append(f"  • {ticker}: RVOL {rvol:.1f}x ({classification_str}) {emoji_str}")
             
-            # Summary
-            summary = article.get('description', '')[:300]
-            if summary:
-                embed['fields'].append({
-                    'name': '📰 Summary',
-                    'value': summary,
-                    'inline': False
-                })
-            
-            # Volume confirmations
-            if volume_confirmations:
-                vol_text = []
-                for ticker, vol_data in list(volume_confirmations.items())[:5]:
-                    rvol = vol_data.get('rvol', 0)
-                    classification_str = vol_data.get('classification', 'N/A')
-                    emoji_str = '⚡⚡⚡' if rvol >= 3.0 else '⚡⚡' if rvol >= 2.5 else '⚡'
-                    vol_text.append(f"  • {ticker}: RVOL {rvol:.1f}x ({classification_str}) {emoji_str}")
+            fields.append({'name': '📊 Volume Confirmation', 'value': '\n'.join(vol_text), 'inline': False})
+        
+        # Spillover opportunities (IMPORTANT)
+        if spillover_opportunities:
+            spillover_text = []
+            for opp in spillover_opportunities[:5]:  # Top 5
+                symbol = opp['symbol']
+                rvol = opp['rvol']
+                change = opp['change_percent']
+                classification_str = opp['classification']
                 
-                embed['fields'].append({
-                    'name': '📊 Volume Confirmation',
-                    'value': '\n'.join(vol_text),
-                    'inline': False
-                })
-            
-            # Spillover opportunities (IMPORTANT)
-            if spillover_opportunities:
-                spillover_text = []
-                for opp in spillover_opportunities[:5]:  # Top 5
-                    symbol = opp['symbol']
-                    rvol = opp['rvol']
-                    change = opp['change_percent']
-                    classification_str = opp['classification']
-                    
-                    emoji_str = '⚡⚡⚡' if opp['critical'] else '⚡⚡' if rvol >= 2.5 else '⚡'
-                    change_str = f"+{change:.1f}%" if change > 0 else f"{change:.1f}%"
-                    
-                    spillover_text.append(
-                        f"  • **{symbol}**: {change_str} | RVOL {rvol:.1f}x ({classification_str}) {emoji_str}"
-                    )
+                emoji_str = '⚡⚡⚡' if opp['critical'] else '⚡⚡' if rvol >= 2.5 else '⚡'
+                change_str = f"+{change:.1f}%" if change > 0 else f"{change:.1f}%"
                 
-                embed['fields'].append({
-                    'name': f'💥 Related Movers ({len(spillover_opportunities)} detected)',
-                    'value': '\n'.join(spillover_text),
-                    'inline': False
-                })
-            
-            # Action items
-            if event_type == 'MACRO':
-                action_text = "✅ Check SPY/QQQ for market direction\n✅ Review watchlist for sector impact\n✅ Adjust position sizing"
-            elif spillover_opportunities:
-                action_text = f"✅ Check {spillover_opportunities[0]['symbol']} for continuation\n✅ Monitor related stocks for entry\n✅ Watch for momentum shifts"
-            elif event_type == 'M&A':
-                action_text = "✅ Check if target stock on watchlist\n✅ Review deal terms and timeline\n✅ Consider arbitrage opportunity"
-            elif event_type == 'ANALYST':
-                action_text = "✅ Review price target change magnitude\n✅ Check volume for validation\n✅ Look for entry on pullback"
-            else:
-                action_text = "✅ Review news details\n✅ Check Bookmap for confirmation\n✅ Monitor for follow-through"
-            
-            embed['fields'].append({
-                'name': '🎯 Action Items',
-                'value': action_text,
-                'inline': False
-            })
+                spillover_text.append(
+                    f"  • **{symbol}**: {change_str} | RVOL {rvol:.1f}x ({classification_str}) {emoji_str}"
+                )
             
-            # Article link
-            embed['fields'].append({
-                'name': '🔗 Read Full Article',
-                'value': f"[Click here]({article.get('article_url', '#')})",
+            fields.append({
+                'name': f'💥 Related Movers ({len(spillover_opportunities)} detected)',
+                'value': '\n'.join(spillover_text),
                 'inline': False
             })
-            
-            # Footer
-            embed['footer'] = {
+        
+        # Action items
+        if spillover_opportunities and event_type != 'MACRO':
+            action_text = self.SPILLOVER_ACTION_TEXT.format(symbol=spillover_opportunities[0]['symbol'])
+        else:
+            action_text = self.ACTION_TEXT.get(event_type, self.DEFAULT_ACTION_TEXT)
+        
+        fields.append({'name': '🎯 Action Items', 'value': action_text, 'inline': False})
+        
+        # Article link
+        fields.append({
+            'name': '🔗 Read Full Article',
+            'value': f"[Click here]({article.get('article_url', '#')})",
+            'inline': False
+        })
+        
+        embed = {
+            'title': title,
+            'description': f"**{article.get('title', 'No title')}**",
+            'color': self.COLOR_MAP.get(priority, 0xFFCC00),
+            'fields': fields,
+            'timestamp': datetime.utcnow().isoformat(),
+            'footer': {
                 'text': f"⚡ Market Impact Monitor • Detected: {time_str}"
             }
+        }
+        
+        return embed
+    
+    def send_discord_alerts(self, alerts: List[Dict]) -> int:
+        """
+        Queue market impact alerts for Discord, return number queued
+        
+        Embeds for a whole check cycle are queued together so the worker
+        packs them into as few multi-embed POSTs as possible.
+        """
+        if not self.discord_webhook:
+            self.logger.warning("Discord webhook not configured")
+            return 0
+        
+        queued = 0
+        for alert_data in alerts:
+            try:
+                embed = self._build_embed(alert_data)
+            except Exception as e:
+                self.logger.error(f"Failed to build Discord alert: {str(e)}")
+                import traceback
+                self.logger.debug(traceback.format_exc())
+                continue
             
-            payload = {'embeds': [embed]}
-            
-            response = requests.post(
-                self.discord_webhook,
-                json=payload,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            self.stats['alerts_sent'] += 1
-            self.alert_counts[datetime.now().hour] += 1
-            
-            self.logger.info(
-                f"✅ Market impact alert sent: {event_type} | "
-                f"Tickers: {', '.join(tickers[:3])} | "
-                f"Impact: {impact_score:.1f}/10"
-            )
+            self._discord_queue.put((embed, alert_data))
+            queued += 1
+        
+        return queued
+    
+    def send_discord_alert(self, alert_data: Dict) -> bool:
+        """Send market impact alert to Discord"""
+        return self.send_discord_alerts([alert_data]) == 1
+    
+    @staticmethod
+    def _embed_length(embed: Dict) -> int:
+        """Characters counted against Discord's 6000-per-message embed limit"""
+        length = len(embed.get('title', '')) + len(embed.get('description', ''))
+        length += len(embed.get('footer', {}).get('text', ''))
+        for field in embed.get('fields', []):
+            length += len(field['name']) + len(field['value'])
+        return length
+    
+    def _post_alerts(self, batch: List) -> int:
+        """Post (embed, alert_data) pairs as multi-embed messages, return alerts sent"""
+        messages = []
+        current = []
+        current_length = 0
+        for embed, alert_data in batch:
+            length = self._embed_length(embed)
+            if current and current_length + length > 6000:
+                messages.append(current)
+                current = []
+                current_length = 0
+            current.append((embed, alert_data))
+            current_length += length
+        if current:
+            messages.append(current)
+        
+        sent = 0
+        for message in messages:
+            try:
+                payload = {'embeds': [embed for embed, _ in message]}
+                
+                response = self.session.post(
+                    self.discord_webhook,
+                    json=payload,
+                    timeout=10
+                )
+                response.raise_for_status()
+            except Exception as e:
+                self.logger.error(f"Failed to send Discord alert batch ({len(message)} embeds): {str(e)}")
+                import traceback
+                self.logger.debug(traceback.format_exc())
+                continue
             
-            # ==================== DATABASE SAVE ====================
-            # Save to database after successful Discord alert
-            if hasattr(self, 'save_to_db_callback') and self.save_to_db_callback:
+            for _, alert_data in message:
+                self._record_alert(alert_data)
+                sent += 1
+        
+        return sent
+    
+    def _record_alert(self, alert_data: Dict):
+        """Update stats and persist an alert after a successful post"""
+        article = alert_data['article']
+        tickers = alert_data['tickers']
+        event_type = alert_data['classification']['type']
+        impact_score = alert_data['impact_score']
+        
+        arrived_at = time.time()
+        with self._alert_lock:
+            self.stats.alerts_sent += 1
+            self.alert_counts[self._current_alert_bucket()] += 1
+            self.arrival_history.append(arrived_at)
+        
+        if self._seen_db is not None:
+            with self._seen_db_lock:
                 try:
-                    # Save for each ticker mentioned (limit to first 5 to avoid spam)
-                    for ticker in tickers[:5]:
-                        self.save_to_db_callback(
-                            ticker=ticker,
-                            headline=article.get('title', 'Market News'),
-                            article=article,
-                            channel='watchlist'
-                        )
-                    
-                    self.logger.debug(f"💾 Saved market impact news to database for {len(tickers[:5])} tickers")
-                except Exception as e:
-                    self.logger.error(f"Error saving to database: {str(e)}")
-            # =====================================================
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to send Discord alert: {str(e)}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
-            return False
+                    self._seen_db.execute("INSERT INTO alert_arrivals (ts) VALUES (?)", (arrived_at,))
+                    self._seen_db.commit()
+                except sqlite3.Error as e:
+                    self.logger.error(f"Error persisting alert arrival: {str(e)}")
+        
+        self.logger.info(
+            f"✅ Market impact alert sent: {event_type} | "
+            f"Tickers: {', '.join(tickers[:3])} | "
+            f"Impact: {impact_score:.1f}/10"
+        )
+        
+        # ==================== DATABASE SAVE ====================
+        # Save to database after successful Discord alert
+        if hasattr(self, 'save_to_db_callback') and self.save_to_db_callback:
+            try:
+                # Save for each ticker mentioned (limit to first 5 to avoid spam)
+                for ticker in tickers[:5]:
+                    self.save_to_db_callback(
+                        ticker=ticker,
+                        headline=article.get('title', 'Market News'),
+                        article=article,
+                        channel='watchlist'
+                    )
+                
+                self.logger.debug(f"💾 Saved market impact news to database for {len(tickers[:5])} tickers")
+            except Exception as e:
+                self.logger.error(f"Error saving to database: {str(e)}")
+        # =====================================================
     
     def run_single_check(self) -> int:
-        """Run a single check cycle"""
+        """Run a single check cycle, returns number of alerts queued for Discord"""
         if not self.enabled:
             return 0
         
@@ -611,34 +1102,152 @@ class MarketImpactMonitor:
             self.logger.info("✅ Check complete - No high-impact news")
             return 0
         
-        alerts_sent = 0
+        return self.send_discord_alerts(matched_articles)
+    
+    def _compute_poll_schedule(self) -> List[float]:
+        """
+        Place poll_budget_per_hour polls within the hour (seconds offsets)
+        
+        Polls are concentrated where impact events historically arrive, using
+        the recurrence L_i = L_{i-1} + (F(L_{i-1}) - F(L_{i-2})) / p(L_{i-1})
+        over a kernel density estimate of alert arrival times. Falls back to
+        uniform spacing until 100 samples have been collected.
+        """
+        period = 3600
+        budget = max(1, int(self.poll_budget_per_hour))
+        with self._alert_lock:
+            samples = np.fromiter((t % period for t in self.arrival_history), dtype=float)
+        
+        n = len(samples)
+        if n < 100:
+            return [i * period / budget for i in range(budget)]
+        
+        # Gaussian KDE on a 1-second circular grid. Scott's rule bandwidth uses the
+        # circular std, so arrivals either side of :00 form one tight cluster
+        angles = samples * (2 * np.pi / period)
+        resultant = np.hypot(np.cos(angles).mean(), np.sin(angles).mean())
+        circular_std = np.sqrt(-2 * np.log(max(resultant, 1e-12))) * period / (2 * np.pi)
+        bandwidth = min(max(circular_std * n ** (-0.2), 10.0), period / 2)
+        
+        # Arrival histogram convolved with a wrapped Gaussian kernel (FFT, circular)
+        counts = np.bincount(np.rint(samples).astype(int) % period, minlength=period)
+        offsets = np.arange(period)
+        kernel = np.exp(-0.5 * (np.minimum(offsets, period - offsets) / bandwidth) ** 2)
+        pdf = np.clip(np.fft.irfft(np.fft.rfft(counts) * np.fft.rfft(kernel), n=period), 0, None)
+        pdf /= pdf.sum()
+        
+        # Mix with a uniform floor so p(t) never reaches zero
+        pdf = 0.95 * pdf + 0.05 / period
+        
+        # cdf[t] is the probability mass before second t (cdf[period] == 1)
+        cdf = np.concatenate(([0.0], np.cumsum(pdf))).tolist()
+        pdf = pdf.tolist()
+        
+        def p_at(t: float) -> float:
+            return pdf[min(int(t), period - 1)]
+        
+        def f_at(t: float) -> float:
+            return cdf[min(int(t), period)]
         
-        for alert_data in matched_articles:
-            success = self.send_discord_alert(alert_data)
-            if success:
-                alerts_sent += 1
+        def build(first: float) -> List[float]:
+            points = [0.0, first]
+            while points[-1] < period and len(points) <= budget:
+                prev, last = points[-2], points[-1]
+                step = (f_at(last) - f_at(prev)) / p_at(last)
+                points.append(last + max(step, 1.0))
+            return [p for p in points if p < period]
         
-        return alerts_sent
+        # Bisect on L_1 so the schedule spends exactly the poll budget
+        low, high = 1.0, period / budget * 4
+        for _ in range(40):
+            mid = (low + high) / 2
+            if len(build(mid)) > budget:
+                low = mid
+            else:
+                high = mid
+        
+        return build(high)[:budget]
+    
+    def _seconds_until_next_poll(self, min_delay: float = 0) -> float:
+        """Seconds until the first scheduled poll at least min_delay away, recomputing hourly"""
+        offset = time.time() % 3600
+        if not self.poll_schedule:
+            self.poll_schedule = self._compute_poll_schedule()
+        
+        hours, target = divmod(offset + min_delay, 3600)
+        index = bisect.bisect_right(self.poll_schedule, target)
+        if index < len(self.poll_schedule):
+            return hours * 3600 + self.poll_schedule[index] - offset
+        
+        # Hour rolled over - learn from the latest arrivals
+        self.poll_schedule = self._compute_poll_schedule()
+        return (hours + 1) * 3600 + self.poll_schedule[0] - offset
+    
+    def _quiet_backoff(self) -> float:
+        """Minimum wait after consecutive empty checks (exponential, capped)"""
+        if not is_market_hours(include_extended=True):
+            return self.max_backoff
+        if self.consecutive_empty == 0:
+            return 0
+        return min(self.check_interval * (2 ** min(self.consecutive_empty, 4)), self.max_backoff)
+    
+    def _update_poll_interval(self, alerts_sent: int):
+        """
+        Adapt the poll interval to news activity
+        
+        While checks keep producing alerts the interval halves (bursty regime),
+        for at most MAX_BURST_SCANS scans. Each empty check doubles it, and once
+        it reaches max_poll_interval the monitor returns to scheduled polls.
+        """
+        self.consecutive_empty = 0 if alerts_sent > 0 else self.consecutive_empty + 1
+        
+        if alerts_sent > 0 and self.burst_scans < self.MAX_BURST_SCANS:
+            current = self.burst_interval or self.max_poll_interval
+            self.burst_interval = max(self.min_poll_interval, current / 2)
+            self.burst_scans += 1
+        elif self.burst_interval is not None:
+            self.burst_interval *= 2
+            if alerts_sent > 0 or self.burst_interval >= self.max_poll_interval:
+                self.burst_interval = None
+                self.burst_scans = 0
+    
+    def _wait_for_next_poll(self):
+        """Block in a single call until the next poll deadline"""
+        if self.burst_interval is not None:
+            delay = self.burst_interval
+        else:
+            delay = max(self._seconds_until_next_poll(self._quiet_backoff()), 0.001)
+        
+        if self._timer_fd is not None:
+            os.timerfd_settime(self._timer_fd, initial=delay)
+            os.read(self._timer_fd, 8)
+        else:
+            time.sleep(delay)
     
     def run_continuous(self):
         """Run continuous monitoring"""
         self.logger.info("Starting market impact monitor...")
-        self.logger.info(f"Check interval: {self.check_interval}s")
+        self.logger.info(f"Poll budget: {self.poll_budget_per_hour}/hour")
+        self.logger.info(f"Burst interval: {self.min_poll_interval}s-{self.max_poll_interval}s")
+        self.logger.info(f"Quiet backoff: up to {self.max_backoff}s")
         self.logger.info(f"Volume threshold: {self.min_rvol}x")
         self.logger.info(f"Monitoring: {len(self.watchlist)} stocks + macro events")
         
         try:
             while True:
+                alerts_sent = 0
                 try:
                     alerts_sent = self.run_single_check()
                     
                     if alerts_sent > 0:
-                        self.logger.info(f"📬 Sent {alerts_sent} market impact alerts")
+                        self.logger.info(f"📬 Queued {alerts_sent} market impact alerts")
                     
                 except Exception as e:
                     self.logger.error(f"Error in check cycle: {str(e)}")
                 
-                time.sleep(self.check_interval)
+                self._update_poll_interval(alerts_sent)
+                
+                self._wait_for_next_poll()
                 
         except KeyboardInterrupt:
             self.logger.info("Stopping market impact monitor...")
@@ -649,58 +1258,94 @@ class MarketImpactMonitor:
         print("\n" + "=" * 60)
         print("MARKET IMPACT MONITOR STATISTICS")
         print("=" * 60)
-        print(f"Macro Events: {self.stats['macro_events']}")
-        print(f"Analyst Events: {self.stats['analyst_events']}")
-        print(f"M&A Events: {self.stats['ma_events']}")
-        print(f"Earnings Events: {self.stats['earnings_events']}")
-        print(f"Spillover Events: {self.stats['spillover_events']}")
-        print(f"Volume Confirmed: {self.stats['volume_confirmed']}")
-        print(f"Alerts Sent: {self.stats['alerts_sent']}")
-        print(f"Filtered (low impact): {self.stats['filtered']}")
+        for label, field in self.STATS_LABELS:
+            print(f"{label}: {getattr(self.stats, field)}")
         print("=" * 60 + "\n")
 
 
 # CLI Testing
+@dataclass(frozen=True)
+class MonitorEnv:
+    """Environment values read once at startup"""
+    api_key: str
+    webhook: Optional[str]
+
+
+REQUIRED_ENV = ('POLYGON_API_KEY',)
+
+
+def load_monitor_env(source: Optional[Dict] = None) -> MonitorEnv:
+    """Snapshot os.environ (or source) and fail with every missing required key at once"""
+    if source is None:
+        source = os.environ
+    env = {key: value for key, value in source.items() if value}
+    
+    try:
+        return MonitorEnv(
+            api_key=env['POLYGON_API_KEY'],
+            webhook=env.get('DISCORD_NEWS_ALERTS')
+        )
+    except KeyError:
+        missing = [key for key in REQUIRED_ENV if not env.get(key)]
+        print(f"❌ Missing required environment variables: {', '.join(missing)}")
+        sys.exit(1)
+
+
 def main():
     """Command-line interface for testing"""
-    import sys
-    import os
-    from dotenv import load_dotenv
-    
-    load_dotenv()
+    import signal
     
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    api_key = os.getenv('POLYGON_API_KEY')
-    webhook = os.getenv('DISCORD_NEWS_ALERTS')
-    
-    if not api_key:
-        print("❌ POLYGON_API_KEY not found")
-        sys.exit(1)
+    # Precompiled by compile_monitor_config.py - skips YAML/dotenv parsing
+    from compile_monitor_config import load_compiled_config
     
-    # Test config
-    config = {
-        'market_impact_monitor': {
-            'enabled': True,
-            'check_interval': 60,
-            'lookback_hours': 2,
-            'max_alerts_per_hour': 20,
-            'min_impact_score': 7.0,
-            'volume_confirmation': {
+    compiled = load_compiled_config()
+    if compiled:
+        config, ENV = compiled
+        env = load_monitor_env(ENV)
+    else:
+        from dotenv import load_dotenv
+        
+        load_dotenv()
+        env = load_monitor_env()
+        
+        # Test config
+        config = {
+            'market_impact_monitor': {
                 'enabled': True,
-                'min_rvol': 2.0,
-                'critical_rvol': 3.0
+                'poll_budget_per_hour': 60,
+                'min_impact_poll_ms': 5000,
+                'max_impact_poll_ms': 60000,
+                'lookback_hours': 2,
+                'max_alerts_per_hour': 20,
+                'min_impact_score': 7.0,
+                'volume_confirmation': {
+                    'enabled': True,
+                    'min_rvol': 2.0,
+                    'critical_rvol': 3.0
+                }
             }
         }
-    }
     
-    monitor = MarketImpactMonitor(api_key, config)
+    monitor = MarketImpactMonitor(env.api_key, config)
+    
+    # The compiled config is the real config.yaml, which may have the monitor
+    # switched off (the fallback test config always enables it)
+    if not monitor.enabled:
+        logging.getLogger(__name__).warning(
+            "⚠️ market_impact_monitor.enabled is false in the compiled config - checks will be skipped"
+        )
+    
+    # kill -HUP <pid> re-reads thresholds from config.yaml
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, lambda *_: monitor.reload_config())
     
-    if webhook:
-        monitor.set_discord_webhook(webhook)
+    if env.webhook:
+        monitor.set_discord_webhook(env.webhook)
     
     if len(sys.argv) > 1 and sys.argv[1] == 'run':
         print("Starting continuous monitoring...")
@@ -709,7 +1354,8 @@ def main():
     else:
         print("Running single check...")
         alerts = monitor.run_single_check()
-        print(f"\n✅ Check complete: {alerts} alerts sent")
+        monitor.drain_alerts()
+        print(f"\n✅ Check complete: {alerts} alerts queued, {monitor.stats.alerts_sent} sent")
         monitor.print_stats()
 
 
@@ -19,17 +19,135 @@ backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 import requests
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
 import logging
+import sqlite3
 import time
-from datetime import datetime, timedelta
-from collections import defaultdict
-from typing import Dict, Optional
+import random
+import queue
+import signal
+import threading
+from datetime import datetime, timedelta, timezone, time as dt_time
+from enum import IntEnum
+from typing import Dict, NamedTuple, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from functools import lru_cache
+from collections import OrderedDict
 
-from analyzers.enhanced_professional_analyzer import EnhancedProfessionalAnalyzer
+from analyzers.enhanced_professional_analyzer import get_shared_analyzer, release_shared_analyzer
 from analyzers.confluence_alert_system import ConfluenceAlertSystem
 
+# orjson (optional) serializes webhook payloads much faster than the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Analyzer signal sections the triggers read: (dark pool, volume, OI, key levels, news)
+SIGNAL_SECTIONS = ('dark_pool_details', 'volume_analysis', 'open_interest', 'key_levels', 'news')
+
+# News sentiment direction for momentum factor 6
+SENTIMENT_SIGN = {'POSITIVE': 1, 'VERY POSITIVE': 1, 'NEGATIVE': -1, 'VERY NEGATIVE': -1}
+
+# Triggers the watchlist prescreen can rule out; PRESCREEN_SKIPS[code] is the
+# set to skip, where bit i of code marks PRESCREEN_TYPES[i] as impossible
+PRESCREEN_TYPES = ('momentum_signal', 'gamma_approach', 'extreme_setup')
+PRESCREEN_SKIPS = tuple(
+    frozenset(alert_type for bit, alert_type in enumerate(PRESCREEN_TYPES) if code >> bit & 1)
+    for code in range(1 << len(PRESCREEN_TYPES))
+)
+
+# Momentum embed styling: signal type -> (title, color)
+MOMENTUM_STYLE = {
+    'momentum_buy': ('🟢 MOMENTUM BUY SIGNAL', 0x00ff00),
+    'momentum_sell': ('🔴 MOMENTUM SELL SIGNAL', 0xff0000)
+}
+
+# Confluence embed styling: priority -> (color, emoji), direction -> emoji
+CONFLUENCE_PRIORITY_STYLE = {
+    'EXTREME': (0xFF0000, '🔥🔥🔥'),  # Red
+    'HIGH': (0xFF6600, '🔥🔥'),       # Orange
+    'MEDIUM': (0xFFD700, '🔥')        # Gold
+}
+DIRECTION_EMOJI = {'BULLISH': '📈', 'BEARISH': '📉'}
+SIGNAL_DIRECTION_EMOJI = {'BULLISH': '🟢', 'BEARISH': '🔴'}
+FACTOR_BULLET = '✅ '
+MAX_INTERPRETATION_CHARS = 500  # Analysis field length, including the "..." on truncation
+
+# Regular session (ET)
+MARKET_OPEN = dt_time(9, 30)
+MARKET_CLOSE = dt_time(16, 0)
+
+
+class Flow(IntEnum):
+    """Institutional dark pool flow; sign gives direction, zero is non-directional"""
+    SELLING = -1
+    NEUTRAL = 0
+    BUYING = 1
+    
+    @classmethod
+    def of(cls, data: dict) -> 'Flow':
+        """Flow of an analyzer signal; unknown or mixed labels are NEUTRAL"""
+        label = (data.get('dark_pool_details') or {}).get('institutional_flow')
+        return cls.__members__.get(label, cls.NEUTRAL)
+
+
+class SymbolFeatures(NamedTuple):
+    """Numeric trigger inputs of one analyzer signal (one prescreen row)"""
+    flow: Flow
+    strength: float
+    rvol: float
+    wall_side: int        # 1 support, -1 resistance, 0 other / none
+    wall_distance: float  # 999 without a wall
+    at_support: bool
+    at_resistance: bool
+    confluence: float
+    price: float
+    vwap: float           # NaN when missing, so price comparisons are False
+    sentiment: int
+    
+    @classmethod
+    def of(cls, data: dict) -> 'SymbolFeatures':
+        """Features of an analyzer signal
+        
+        The signal dict is the analyzer's (and the signal cache's), so the
+        features are kept by the monitor rather than stored on it.
+        """
+        dark_pool, volume_analysis, open_interest, key_levels, news = (
+            data.get(k) or {} for k in SIGNAL_SECTIONS
+        )
+        wall = open_interest.get('nearest_wall') or {}
+        wall_type = wall.get('type')
+        vwap = data.get('vwap')
+        return cls(
+            Flow.of(data),
+            dark_pool.get('signal_strength') or 0,
+            (volume_analysis.get('rvol') or {}).get('rvol') or 0,
+            1 if wall_type == 'support' else -1 if wall_type == 'resistance' else 0,
+            wall.get('distance_pct', 999),
+            bool(key_levels.get('at_support')),
+            bool(key_levels.get('at_resistance')),
+            key_levels.get('confluence_score') or 0,
+            data.get('current_price') or 0,
+            np.nan if vwap is None else vwap,
+            SENTIMENT_SIGN.get(news.get('sentiment'), 0)
+        )
+
+
+@lru_cache(maxsize=64)
+def signal_display_name(name: str) -> str:
+    """'rvol_spike' -> 'Rvol Spike' (confluence signal names are a small fixed set)"""
+    return name.replace('_', ' ').title()
+
 
 class MomentumSignalMonitor:
+    # Every alert type check_symbol can emit (used for the cooldown pre-filter)
+    ALERT_TYPES = ('extreme_setup', 'dark_pool_flip', 'gamma_approach', 'momentum_signal', 'confluence_alert')
+    
     def __init__(self, polygon_api_key: str, discord_alerter=None, config: dict = None, watchlist_manager=None):
         """
         Initialize Momentum Signal Monitor
@@ -54,8 +172,9 @@ class MomentumSignalMonitor:
         self.check_interval = self.config.get('check_interval', 30)
         self.market_hours_only = self.config.get('market_hours_only', True)
         
-        # Cooldown tracking
-        self.last_alert = defaultdict(lambda: defaultdict(float))
+        # Cooldown tracking, keyed by (symbol, alert_type). Times are time.monotonic()
+        # readings (immune to NTP/DST clock changes), so they are only valid in-process
+        self.last_alert = {}
         self.cooldowns = self.config.get('cooldown_minutes', {
             'momentum_signal': 5,
             'gamma_approach': 3,
@@ -63,10 +182,16 @@ class MomentumSignalMonitor:
             'extreme_setup': 10,
             'confluence_alert': 5  # Same as momentum
         })
+        self._cooldown_seconds = {alert_type: minutes * 60 for alert_type, minutes in self.cooldowns.items()}
+        
+        # Longest the loop sleeps past check_interval while every symbol is cooling down
+        self.max_idle_seconds = self.config.get('max_idle_seconds', 300)
+        self._watched_symbols = ()
         
         # Thresholds
         thresholds = self.config.get('thresholds', {})
         self.min_rvol = thresholds.get('min_rvol', 1.5)
+        self.high_rvol = thresholds.get('high_rvol', 2.0)  # Gamma approach confirmation
         self.extreme_rvol = thresholds.get('extreme_rvol', 3.0)
         self.min_dark_pool_strength = thresholds.get('min_dark_pool_strength', 3)
         self.min_dark_pool_value = thresholds.get('min_dark_pool_value', 1000000)
@@ -81,12 +206,32 @@ class MomentumSignalMonitor:
         self.min_price = filters.get('min_price', 5.0)
         self.max_alerts_per_symbol_per_day = filters.get('max_alert_per_symbol_per_day', 5)
         
+        # Short-lived analyzer results so fast cycles don't recompute unchanged minute bars
+        self.signal_ttl = self.config.get('signal_ttl_seconds', max(30, self.check_interval // 2))
+        self._signal_cache = OrderedDict()
+        
+        # Confluence analysis is skipped for signals older than this
+        self.max_data_age = self.config.get('max_data_age_seconds', 120)
+        
         # Track previous dark pool direction
-        self.previous_dark_pool_direction = {}
+        self.previous_dark_pool_direction = OrderedDict()
+        
+        # Per-symbol state is kept LRU-bounded for long-running daemons
+        self.max_tracked_symbols = self.config.get('max_tracked_symbols', 2000)
         
         # Daily alert counter
-        self.daily_alerts = defaultdict(int)
-        self.last_reset_date = datetime.now().date()
+        self.daily_alerts = {}
+        self._next_reset_ts = self._next_midnight_ts()
+        
+        # Cooldowns and daily counts are persisted so a restart mid-session doesn't re-alert
+        self.alert_db_path = self.config.get(
+            'alert_state_db', str(backend_dir / 'data' / 'momentum_alerts.db')
+        )
+        self._alert_db = None
+        self._load_alert_state()
+        
+        # Epoch bounds of the current (or next) session, refreshed after each close
+        self._market_open_ts, self._market_close_ts = self._session_bounds(datetime.now())
         
         # Statistics
         self.stats = {
@@ -96,18 +241,98 @@ class MomentumSignalMonitor:
             'gamma_approaches': 0,
             'dark_pool_flips': 0,
             'extreme_setups': 0,
-            'total_alerts_sent': 0
+            'total_alerts_sent': 0,
+            'flip_cache_evictions': 0,
+            'timeouts': 0
         }
         
-        # Initialize analyzer
-        self.analyzer = EnhancedProfessionalAnalyzer(
-            polygon_api_key=polygon_api_key,
-            debug_mode=False
+        # Concurrent symbol scans - analyzer calls are blocking Polygon I/O,
+        # so a bounded thread pool overlaps their round-trips
+        self.max_concurrent_symbols = self.config.get(
+            'max_concurrent_symbols', min(16, (os.cpu_count() or 4) * 4)
         )
+        self._scan_pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_symbols,
+            thread_name_prefix='MomentumScan'
+        )
+        
+        # Per-symbol fetch budget; a hung symbol is dropped for the cycle
+        # instead of stalling it (logged once until it recovers)
+        self.per_symbol_timeout = self.config.get('per_symbol_timeout_sec', 15)
+        self._slow_symbols = set()
+        # Timed-out fetches still occupying a pool worker (futures can't be cancelled once running)
+        self._overdue = set()
+        self._state_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        
+        # Loop error backoff in seconds, doubled per consecutive failure (capped at 5 min)
+        self._error_backoff = 1
+        
+        # Embed timestamps, formatted once per check cycle
+        self._stamp_cycle()
+        
+        # Discord posting runs on a background worker, batching up to 10 embeds
+        # (6000 embed characters) per webhook call, so webhook latency never blocks symbol scans
+        self.alert_q = queue.Queue(maxsize=self.config.get('alert_queue_size', 500))
+        self.max_embeds_per_post = 10
+        self.max_embed_chars_per_post = 6000
+        self.flush_interval = self.config.get('flush_interval_seconds', 2.0)
+        self._alerts_queued = 0
+        self._discord_cooldown_until = 0.0
+        
+        # Direct webhook (set_discord_webhook) posts over a pooled keep-alive session
+        self.discord_webhook = None
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset({'POST'}),
+                respect_retry_after_header=False  # 429s are paced by the worker
+            )
+        ))
+        
+        self._discord_thread = threading.Thread(
+            target=self._webhook_worker,
+            daemon=True,
+            name='MomentumDiscord'
+        )
+        self._discord_thread.start()
+        
+        # Initialize analyzer (shared with other monitors using the same key)
+        self.analyzer = get_shared_analyzer(polygon_api_key)
+        self._analyzer_held = True
         
         # Initialize Confluence Alert System (Feature #5)
         self.confluence_system = ConfluenceAlertSystem()
         
+        # Trigger dispatch in priority order:
+        # (checker, embed builder, cooldown type, ((stat key, log line), ...) per signal, stop after hit,
+        #  tracks state - runs even while cooling down)
+        # Checkers take (symbol, data, features) and return a signal, None, or a tuple
+        # of signals matching the outcomes
+        self._triggers = (
+            # Trigger 5: Extreme Setup (highest priority - skips the rest)
+            (self.check_extreme_setup, self.create_extreme_setup_embed, 'extreme_setup',
+             (('extreme_setups', "🔥 EXTREME SETUP ALERT: {symbol}"),), True, False),
+            # Trigger 4: Dark Pool Flip (time sensitive)
+            (self.check_dark_pool_flip, self.create_dark_pool_flip_embed, 'dark_pool_flip',
+             (('dark_pool_flips', "🔄 DARK POOL FLIP ALERT: {symbol} ({signal[previous]} → {signal[current]})"),), False, True),
+            # Trigger 3: Gamma Wall Approach
+            (self.check_gamma_wall_approach, self.create_gamma_approach_embed, 'gamma_approach',
+             (('gamma_approaches', "⚡ GAMMA APPROACH ALERT: {symbol} (${signal[wall][strike]})"),), False, False),
+            # Triggers 1 & 2: Momentum Buy / Sell (single factor scan)
+            (self.check_momentum_signals, self.create_momentum_signal_embed, 'momentum_signal',
+             (('momentum_buy_signals', "🟢 MOMENTUM BUY ALERT: {symbol} ({signal[factor_count]} factors)"),
+              ('momentum_sell_signals', "🔴 MOMENTUM SELL ALERT: {symbol} ({signal[factor_count]} factors)")), False, False),
+            # FEATURE #5: Confluence Alert (75%+ confidence)
+            (self.check_confluence_alert, self.create_confluence_embed, 'confluence_alert',
+             ((None, "🎯 CONFLUENCE ALERT: {symbol} ({signal[confluence][confidence]:.0f}% - {signal[confluence][priority]})"),), False, False),
+        )
+        
         self.logger.info("✅ Momentum Signal Monitor initialized")
         self.logger.info(f"   Check Interval: {self.check_interval}s")
         self.logger.info(f"   Min RVOL: {self.min_rvol}x")
@@ -115,316 +340,529 @@ class MomentumSignalMonitor:
         self.logger.info(f"   Gamma Wall Distance: {self.gamma_wall_distance}%")
         self.logger.info(f"   🎯 Confluence alerts: 75%+ confidence")
     
+    @staticmethod
+    def _session_bounds(now: datetime) -> Tuple[float, float]:
+        """Epoch open/close (9:30 AM - 4:00 PM ET) of the session in progress or the next weekday's"""
+        day = now.date()
+        while True:
+            if day.weekday() < 5:  # Saturday = 5, Sunday = 6
+                close = datetime.combine(day, MARKET_CLOSE)
+                if now <= close:
+                    return datetime.combine(day, MARKET_OPEN).timestamp(), close.timestamp()
+            day += timedelta(days=1)
+    
+    @staticmethod
+    def _next_midnight_ts() -> float:
+        """Epoch time of the next local midnight"""
+        tomorrow = datetime.now().date() + timedelta(days=1)
+        return datetime.combine(tomorrow, dt_time(0, 0)).timestamp()
+    
     def is_market_hours(self) -> bool:
         """Check if currently in market hours"""
-        now = datetime.now()
-        
-        # Check if weekday
-        if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
-        
-        # Check time (9:30 AM - 4:00 PM ET)
-        current_time = now.time()
-        market_open = datetime.strptime("09:30", "%H:%M").time()
-        market_close = datetime.strptime("16:00", "%H:%M").time()
+        now = time.time()
+        if now > self._market_close_ts:
+            self._market_open_ts, self._market_close_ts = self._session_bounds(datetime.now())
         
-        return market_open <= current_time <= market_close
+        return self._market_open_ts <= now <= self._market_close_ts
+    
+    def _stamp_cycle(self):
+        """Format the embed timestamp/footer times shared by every alert in a cycle"""
+        # One clock read, so the UTC timestamp and ET clock name the same instant
+        utc_now = datetime.now(timezone.utc)
+        now = utc_now.astimezone()
+        self._cycle_timestamp = utc_now.replace(tzinfo=None).isoformat()
+        self._cycle_footer = now.strftime('%I:%M %p ET')
+        self._cycle_clock = now.strftime('%H:%M:%S ET')
     
     def reset_daily_counters(self):
         """Reset daily alert counters at midnight"""
-        today = datetime.now().date()
-        if today != self.last_reset_date:
+        if time.time() >= self._next_reset_ts:
             self.daily_alerts.clear()
-            self.last_reset_date = today
+            
+            # Expired cooldowns behave like no entry; drop them so retired symbols don't accumulate
+            now = time.monotonic()
+            with self._state_lock:
+                self.last_alert = {
+                    key: alerted_at for key, alerted_at in self.last_alert.items()
+                    if now - alerted_at < self._cooldown_seconds.get(key[1], 900)
+                }
+                self._prune_alert_state()
+            
+            self._next_reset_ts = self._next_midnight_ts()
             self.logger.info("📅 Daily alert counters reset")
     
-    def can_alert(self, symbol: str, alert_type: str) -> bool:
-        """Check if can send alert (cooldown + daily limit)"""
+    def can_alert(self, symbol: str, alert_type: str, now: float = None) -> bool:
+        """Check if can send alert (cooldown + daily limit); now is a time.monotonic() reading"""
         # Check daily limit
-        if self.daily_alerts[symbol] >= self.max_alerts_per_symbol_per_day:
+        if self.daily_alerts.get(symbol, 0) >= self.max_alerts_per_symbol_per_day:
             return False
         
         # Check cooldown
-        now = time.time()
-        last_alert_time = self.last_alert[symbol][alert_type]
-        cooldown_seconds = self.cooldowns.get(alert_type, 15) * 60
+        last_alert_time = self.last_alert.get((symbol, alert_type))
+        if last_alert_time is None:
+            return True
         
-        if now - last_alert_time < cooldown_seconds:
+        if now is None:
+            now = time.monotonic()
+        return now - last_alert_time >= self._cooldown_seconds.get(alert_type, 900)
+    
+    def _alertable(self, symbol: str, now: float) -> bool:
+        """Whether any trigger could alert for symbol (daily cap checked once)"""
+        if self.daily_alerts.get(symbol, 0) >= self.max_alerts_per_symbol_per_day:
             return False
         
-        return True
+        for alert_type in self.ALERT_TYPES:
+            last_alert_time = self.last_alert.get((symbol, alert_type))
+            if last_alert_time is None or now - last_alert_time >= self._cooldown_seconds.get(alert_type, 900):
+                return True
+        return False
     
-    def mark_alerted(self, symbol: str, alert_type: str):
-        """Mark symbol as alerted"""
-        self.last_alert[symbol][alert_type] = time.time()
-        self.daily_alerts[symbol] += 1
+    def seconds_until_alertable(self, symbols) -> float:
+        """Seconds until the first of symbols leaves cooldown (0 if one can alert now)"""
+        if not symbols:
+            return 0.0
+        
+        now = time.monotonic()
+        soonest = float('inf')
+        for symbol in symbols:
+            if self.daily_alerts.get(symbol, 0) >= self.max_alerts_per_symbol_per_day:
+                continue  # Done until the daily reset
+            
+            for alert_type in self.ALERT_TYPES:
+                last_alert_time = self.last_alert.get((symbol, alert_type))
+                if last_alert_time is None:
+                    return 0.0
+                remaining = last_alert_time + self._cooldown_seconds.get(alert_type, 900) - now
+                if remaining <= 0:
+                    return 0.0
+                soonest = min(soonest, remaining)
+        
+        return soonest
     
-    def send_discord_alert(self, embed: dict):
-        """Send alert to Discord"""
-        if not self.discord_alerter:
-            return False
+    def mark_alerted(self, symbol: str, alert_type: str) -> Optional[float]:
+        """Mark symbol as alerted, returns the alert time it replaces
         
+        The cooldown is held in memory while the alert is queued; it's persisted
+        once Discord accepts the alert, or given back if the post fails.
+        """
+        with self._state_lock:
+            previous = self.last_alert.get((symbol, alert_type))
+            self.last_alert[(symbol, alert_type)] = time.monotonic()
+            self.daily_alerts[symbol] = self.daily_alerts.get(symbol, 0) + 1
+        return previous
+    
+    def _unmark_alerted(self, symbol: str, alert_type: str, previous: Optional[float]):
+        """Give back the cooldown and daily count of an alert Discord never received"""
+        with self._state_lock:
+            if previous is None:
+                self.last_alert.pop((symbol, alert_type), None)
+            else:
+                self.last_alert[(symbol, alert_type)] = previous
+            if self.daily_alerts.get(symbol):
+                self.daily_alerts[symbol] -= 1
+    
+    def _persist_alert(self, symbol: str, alert_type: str):
+        """Persist the cooldown and daily count of a delivered alert"""
+        with self._state_lock:
+            if self._alert_db is not None:
+                try:
+                    self._alert_db.execute(
+                        "INSERT OR REPLACE INTO last_alert (symbol, alert_type, ts) VALUES (?, ?, ?)",
+                        (symbol, alert_type, time.time())
+                    )
+                    self._alert_db.execute(
+                        "INSERT INTO daily_alerts (day, symbol, count) VALUES (?, ?, 1) "
+                        "ON CONFLICT (day, symbol) DO UPDATE SET count = count + 1",
+                        (datetime.now().date().isoformat(), symbol)
+                    )
+                    self._alert_db.commit()
+                except sqlite3.Error as e:
+                    self.logger.error(f"Error persisting momentum alert state: {str(e)}")
+    
+    def _load_alert_state(self):
+        """Open the alert state store (SQLite WAL) and restore live cooldowns and today's counts"""
         try:
-            payload = {'embeds': [embed]}
-            self.discord_alerter.send_webhook('MOMENTUM_SIGNALS', payload)
+            Path(self.alert_db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.alert_db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS last_alert (
+                    symbol TEXT NOT NULL,
+                    alert_type TEXT NOT NULL,
+                    ts REAL NOT NULL,
+                    PRIMARY KEY (symbol, alert_type)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS daily_alerts (
+                    day TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (day, symbol)
+                )
+            """)
+            conn.commit()
+            self._alert_db = conn
             
-            self.stats['total_alerts_sent'] += 1
-            return True
+            self._prune_alert_state()
+            today = datetime.now().date().isoformat()
+            self.daily_alerts.update(
+                conn.execute("SELECT symbol, count FROM daily_alerts WHERE day = ?", (today,)).fetchall()
+            )
             
-        except Exception as e:
-            self.logger.error(f"Failed to send Discord alert: {str(e)}")
-            return False
+            # Stored as epoch seconds; live cooldowns move onto this process's monotonic clock
+            now = time.time()
+            offset = time.monotonic() - now
+            for symbol, alert_type, ts in conn.execute("SELECT symbol, alert_type, ts FROM last_alert"):
+                if now - ts < self._cooldown_seconds.get(alert_type, 900):
+                    self.last_alert[(symbol, alert_type)] = ts + offset
+            
+            self.logger.info(f"💾 Restored {len(self.last_alert)} momentum cooldowns from {self.alert_db_path}")
+        except sqlite3.Error as e:
+            self.logger.error(f"⚠️ Momentum alert state store unavailable, cooldowns are in-memory only: {str(e)}")
+            self._alert_db = None
     
-    def check_momentum_buy_signal(self, symbol: str, data: dict) -> Optional[dict]:
-        """
-        TRIGGER 1: Momentum Buy Signal
-        Requires 4+ bullish factors
-        """
-        factors = []
-        factor_count = 0
+    def _prune_alert_state(self):
+        """Delete persisted cooldowns that have expired and counts from previous days"""
+        if self._alert_db is None:
+            return
+        try:
+            longest_cooldown = max(900, *self._cooldown_seconds.values())
+            self._alert_db.execute("DELETE FROM last_alert WHERE ts < ?", (time.time() - longest_cooldown,))
+            self._alert_db.execute("DELETE FROM daily_alerts WHERE day != ?", (datetime.now().date().isoformat(),))
+            self._alert_db.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error pruning momentum alert state: {str(e)}")
+    
+    def _increment_stat(self, key: str):
+        """Bump a stats counter (symbols are scanned from worker threads)"""
+        with self._state_lock:
+            self.stats[key] += 1
+    
+    def set_discord_webhook(self, webhook_url: str):
+        """Set Discord webhook URL (posts directly instead of via discord_alerter)"""
+        self.discord_webhook = webhook_url
+        self.logger.info("✅ Discord webhook configured for momentum signals")
+    
+    @staticmethod
+    def _embed_length(embed: dict) -> int:
+        """Characters counted against Discord's 6000-per-message embed limit"""
+        length = len(embed.get('title', '')) + len(embed.get('description', ''))
+        length += len(embed.get('footer', {}).get('text', ''))
+        length += len(embed.get('author', {}).get('name', ''))
+        for field in embed.get('fields', []):
+            length += len(field['name']) + len(field['value'])
+        return length
+    
+    def _post_embeds(self, embeds: list) -> bool:
+        """Post one batch of embeds to the momentum channel"""
+        payload = {'embeds': embeds}
+        if not self.discord_webhook:
+            return bool(self.discord_alerter.send_webhook('MOMENTUM_SIGNALS', payload))
+        
+        # Serialized once, reused across rate-limit retries
+        if ORJSON_AVAILABLE:
+            body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            body = json.dumps(payload).encode('utf-8')
         
-        # Factor 1: Dark Pool Buying
-        dark_pool = data.get('dark_pool_details', {})
-        if dark_pool.get('institutional_flow') == 'BUYING':
-            strength = dark_pool.get('signal_strength', 0)
-            if strength >= self.min_dark_pool_strength:
-                factors.append(f"Dark Pool BUYING (strength: {strength})")
-                factor_count += 1
-        
-        # Factor 2: High RVOL
-        volume_analysis = data.get('volume_analysis', {})
-        rvol_data = volume_analysis.get('rvol', {})
-        rvol = rvol_data.get('rvol', 0)
-        if rvol >= self.min_rvol:
-            factors.append(f"RVOL {rvol:.1f}x ({rvol_data.get('classification', 'HIGH')})")
-            factor_count += 1
-        
-        # Factor 3: Near Gamma Wall Support
-        open_interest = data.get('open_interest', {})
-        nearest_wall = open_interest.get('nearest_wall')
-        if nearest_wall and nearest_wall['type'] == 'support':
-            distance = nearest_wall.get('distance_pct', 999)
-            if distance <= self.gamma_wall_distance:
-                factors.append(f"Gamma Support ${nearest_wall['strike']} ({distance:.1f}% away)")
-                factor_count += 1
-        
-        # Factor 4: High Confluence Support
-        key_levels = data.get('key_levels', {})
-        if key_levels.get('at_support') and key_levels.get('confluence_score', 0) >= self.min_confluence:
-            confluence = key_levels['confluence_score']
-            factors.append(f"High Confluence Support ({confluence}/10)")
-            factor_count += 1
-        
-        # Factor 5: Price Below VWAP (oversold)
-        if data.get('current_price', 0) < data.get('vwap', 999999):
-            factors.append("Price < VWAP (oversold)")
-            factor_count += 1
-        
-        # Factor 6: Positive News
-        news = data.get('news', {})
-        if news.get('sentiment') in ['POSITIVE', 'VERY POSITIVE']:
-            factors.append(f"News: {news['sentiment']}")
-            factor_count += 1
+        # Rate limited: hold every post until Discord's Retry-After elapses
+        for attempt in range(3):
+            wait = self._discord_cooldown_until - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            
+            response = self.http.post(
+                self.discord_webhook,
+                data=body,
+                headers={'Content-Type': 'application/json'},
+                timeout=10
+            )
+            if response.status_code != 429:
+                response.raise_for_status()
+                return True
+            
+            # The JSON body has the exact delay; the Retry-After header is rounded
+            try:
+                retry_after = float(response.json()['retry_after'])
+            except (ValueError, KeyError, TypeError):
+                retry_after = float(response.headers.get('Retry-After', 1))
+            self._discord_cooldown_until = time.monotonic() + retry_after
+            self.logger.warning("⚠️ Discord rate limited, retrying in %.1fs", retry_after)
         
-        # Need 4+ factors
-        if factor_count >= 4:
-            return {
-                'type': 'momentum_buy',
-                'factors': factors,
-                'factor_count': factor_count,
-                'confidence': min(factor_count / 6 * 100, 95),
-                'data': data
-            }
+        return False
+    
+    def send_discord_alert(self, embed: dict, symbol: str = None, alert_type: str = None):
+        """Queue alert for the Discord worker, marking symbol alerted for alert_type if given"""
+        if not self.discord_alerter and not self.discord_webhook:
+            return False
         
-        return None
+        previous = self.mark_alerted(symbol, alert_type) if symbol else None
+        try:
+            self.alert_q.put_nowait((embed, symbol, alert_type, previous))
+        except queue.Full:
+            self.logger.error("Discord alert queue full, dropping momentum alert")
+            if symbol:
+                self._unmark_alerted(symbol, alert_type, previous)
+            return False
+        
+        with self._state_lock:
+            self._alerts_queued += 1
+        return True
+    
+    def _webhook_worker(self):
+        """Drain queued embeds in batches so webhook latency never delays the scan"""
+        deferred = []  # Batch still rate limited after _post_embeds' retries
+        deferrals = 0
+        overflow = None  # Alert that would have pushed the previous batch past the size limit
+        while True:
+            if deferred:
+                batch = deferred
+            else:
+                batch = [overflow or self.alert_q.get()]
+                overflow = None
+            deferred = []
+            length = sum(self._embed_length(alert[0]) for alert in batch)
+            deadline = time.monotonic() + self.flush_interval
+            
+            # Collect up to Discord's 10-embed / 6000-character limits or until the flush interval
+            while len(batch) < self.max_embeds_per_post and overflow is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    alert = self.alert_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                
+                embed_length = self._embed_length(alert[0])
+                if length + embed_length > self.max_embed_chars_per_post:
+                    overflow = alert  # Opens the next batch
+                    break
+                batch.append(alert)
+                length += embed_length
+            
+            delivered = False
+            try:
+                if self._post_embeds([embed for embed, _, _, _ in batch]):
+                    delivered = True
+                    with self._state_lock:
+                        self.stats['total_alerts_sent'] += len(batch)
+                elif self._discord_cooldown_until > time.monotonic() and deferrals < 3:
+                    # Hold the batch for the next pass (after Retry-After) instead of dropping it
+                    deferred = batch
+                    deferrals += 1
+                    self.logger.warning("⚠️ Deferring %d alerts until Discord rate limit clears", len(batch))
+                else:
+                    self.logger.error("Discord rejected batch of %d alerts", len(batch))
+            except Exception as e:
+                self.logger.error("Failed to send Discord alert: %s", e)
+            
+            if not deferred:
+                deferrals = 0
+                self._settle_alerts(batch, delivered)
+                for _ in batch:
+                    self.alert_q.task_done()
+    
+    def _settle_alerts(self, batch: list, delivered: bool):
+        """Persist the cooldowns of a delivered batch, or give back those of a dropped one"""
+        for _, symbol, alert_type, previous in batch:
+            if not symbol:
+                continue
+            if delivered:
+                self._persist_alert(symbol, alert_type)
+            else:
+                self._unmark_alerted(symbol, alert_type, previous)
+    
+    def drain_alerts(self):
+        """Block until every queued alert has been posted"""
+        self.alert_q.join()
     
-    def check_momentum_sell_signal(self, symbol: str, data: dict) -> Optional[dict]:
+    def check_momentum_signals(self, symbol: str, data: dict,
+                               feat: Optional[SymbolFeatures] = None) -> Tuple[Optional[dict], Optional[dict]]:
         """
-        TRIGGER 2: Momentum Sell Signal
-        Requires 4+ bearish factors
+        TRIGGERS 1 & 2: Momentum Buy / Sell Signals
+        Scores bullish and bearish factors in one pass; each side needs 4+
         """
-        factors = []
-        factor_count = 0
-        
-        # Factor 1: Dark Pool Selling
-        dark_pool = data.get('dark_pool_details', {})
-        if dark_pool.get('institutional_flow') == 'SELLING':
-            strength = dark_pool.get('signal_strength', 0)
-            if strength >= self.min_dark_pool_strength:
-                factors.append(f"Dark Pool SELLING (strength: {strength})")
-                factor_count += 1
-        
-        # Factor 2: High RVOL
-        volume_analysis = data.get('volume_analysis', {})
-        rvol_data = volume_analysis.get('rvol', {})
-        rvol = rvol_data.get('rvol', 0)
-        if rvol >= self.min_rvol:
-            factors.append(f"RVOL {rvol:.1f}x ({rvol_data.get('classification', 'HIGH')})")
-            factor_count += 1
-        
-        # Factor 3: Near Gamma Wall Resistance
-        open_interest = data.get('open_interest', {})
-        nearest_wall = open_interest.get('nearest_wall')
-        if nearest_wall and nearest_wall['type'] == 'resistance':
-            distance = nearest_wall.get('distance_pct', 999)
-            if distance <= self.gamma_wall_distance:
-                factors.append(f"Gamma Resistance ${nearest_wall['strike']} ({distance:.1f}% away)")
-                factor_count += 1
-        
-        # Factor 4: High Confluence Resistance
-        key_levels = data.get('key_levels', {})
-        if key_levels.get('at_resistance') and key_levels.get('confluence_score', 0) >= self.min_confluence:
-            confluence = key_levels['confluence_score']
-            factors.append(f"High Confluence Resistance ({confluence}/10)")
-            factor_count += 1
-        
-        # Factor 5: Price Above VWAP (overbought)
-        if data.get('current_price', 0) > data.get('vwap', 0):
-            factors.append("Price > VWAP (overbought)")
-            factor_count += 1
-        
-        # Factor 6: Negative News
-        news = data.get('news', {})
-        if news.get('sentiment') in ['NEGATIVE', 'VERY NEGATIVE']:
-            factors.append(f"News: {news['sentiment']}")
-            factor_count += 1
+        if feat is None:
+            feat = SymbolFeatures.of(data)
+        buy_factors = []
+        sell_factors = []
+        
+        # Factor 1: Dark Pool Buying / Selling
+        flow = feat.flow
+        if flow and feat.strength >= self.min_dark_pool_strength:
+            side = buy_factors if flow > 0 else sell_factors
+            side.append(f"Dark Pool {flow.name} (strength: {feat.strength})")
+        
+        # Factor 2: High RVOL (confirms either direction)
+        if feat.rvol >= self.min_rvol:
+            classification = data['volume_analysis']['rvol'].get('classification', 'HIGH')
+            rvol_factor = f"RVOL {feat.rvol:.1f}x ({classification})"
+            buy_factors.append(rvol_factor)
+            sell_factors.append(rvol_factor)
+        
+        # Factor 3: Near Gamma Wall Support / Resistance
+        if feat.wall_side and feat.wall_distance <= self.gamma_wall_distance:
+            strike = data['open_interest']['nearest_wall']['strike']
+            if feat.wall_side > 0:
+                buy_factors.append(f"Gamma Support ${strike} ({feat.wall_distance:.1f}% away)")
+            else:
+                sell_factors.append(f"Gamma Resistance ${strike} ({feat.wall_distance:.1f}% away)")
+        
+        # Three factors remain; a side with none so far can't reach 4
+        if not buy_factors and not sell_factors:
+            return None, None
+        
+        # Factor 4: High Confluence Support / Resistance
+        if feat.confluence >= self.min_confluence:
+            if feat.at_support:
+                buy_factors.append(f"High Confluence Support ({feat.confluence}/10)")
+            if feat.at_resistance:
+                sell_factors.append(f"High Confluence Resistance ({feat.confluence}/10)")
+        
+        # Factor 5: Price vs VWAP (below = oversold, above = overbought; no VWAP = neither)
+        if feat.price < feat.vwap:
+            buy_factors.append("Price < VWAP (oversold)")
+        elif feat.price > feat.vwap:
+            sell_factors.append("Price > VWAP (overbought)")
+        
+        # Factor 6: News sentiment
+        if feat.sentiment:
+            side = buy_factors if feat.sentiment > 0 else sell_factors
+            side.append(f"News: {data['news']['sentiment']}")
         
         # Need 4+ factors
-        if factor_count >= 4:
-            return {
-                'type': 'momentum_sell',
-                'factors': factors,
-                'factor_count': factor_count,
-                'confidence': min(factor_count / 6 * 100, 95),
-                'data': data
-            }
+        return (
+            self._momentum_signal('momentum_buy', buy_factors, data),
+            self._momentum_signal('momentum_sell', sell_factors, data)
+        )
+    
+    @staticmethod
+    def _momentum_signal(signal_type: str, factors: list, data: dict) -> Optional[dict]:
+        """Build a momentum signal when enough factors align"""
+        factor_count = len(factors)
+        if factor_count < 4:
+            return None
         
-        return None
+        return {
+            'type': signal_type,
+            'factors': factors,
+            'factor_count': factor_count,
+            'confidence': min(factor_count / 6 * 100, 95),
+            'data': data
+        }
     
-    def check_gamma_wall_approach(self, symbol: str, data: dict) -> Optional[dict]:
+    def check_gamma_wall_approach(self, symbol: str, data: dict,
+                                  feat: Optional[SymbolFeatures] = None) -> Optional[dict]:
         """
         TRIGGER 3: Gamma Wall Approach
         Price within 0.5-1% of gamma wall + RVOL confirmation
         """
-        open_interest = data.get('open_interest', {})
-        nearest_wall = open_interest.get('nearest_wall')
+        if feat is None:
+            feat = SymbolFeatures.of(data)
         
-        if not nearest_wall:
-            return None
-        
-        distance = nearest_wall.get('distance_pct', 999)
-        
-        # Must be within threshold
-        if distance > self.gamma_wall_distance:
+        # Must be within threshold (999 without a wall)
+        if feat.wall_distance > self.gamma_wall_distance:
             return None
         
         # RVOL confirmation
-        volume_analysis = data.get('volume_analysis', {})
-        rvol = volume_analysis.get('rvol', {}).get('rvol', 0)
-        
-        if rvol < 2.0:  # Need at least 2x RVOL
+        if feat.rvol < self.high_rvol:
             return None
         
-        # Dark Pool confirmation
-        dark_pool = data.get('dark_pool_details', {})
-        flow = dark_pool.get('institutional_flow', 'NEUTRAL')
-        
-        # Check if flow matches wall type
-        if nearest_wall['type'] == 'support' and flow != 'BUYING':
-            return None
-        if nearest_wall['type'] == 'resistance' and flow != 'SELLING':
+        # Dark Pool confirmation: flow must match a support / resistance wall
+        if feat.wall_side and feat.flow != feat.wall_side:
             return None
         
-        urgency = 'URGENT' if distance <= self.gamma_wall_urgent else 'HIGH'
+        urgency = 'URGENT' if feat.wall_distance <= self.gamma_wall_urgent else 'HIGH'
         
         return {
             'type': 'gamma_approach',
-            'wall': nearest_wall,
-            'distance': distance,
-            'rvol': rvol,
-            'flow': flow,
+            'wall': data['open_interest']['nearest_wall'],
+            'distance': feat.wall_distance,
+            'rvol': feat.rvol,
+            'flow': (data.get('dark_pool_details') or {}).get('institutional_flow', 'NEUTRAL'),
             'urgency': urgency,
             'data': data
         }
     
-    def check_dark_pool_flip(self, symbol: str, data: dict) -> Optional[dict]:
+    def check_dark_pool_flip(self, symbol: str, data: dict,
+                             feat: Optional[SymbolFeatures] = None) -> Optional[dict]:
         """
         TRIGGER 4: Dark Pool Direction Change
         Institutional flow flipped in last check
         """
-        dark_pool = data.get('dark_pool_details', {})
-        current_flow = dark_pool.get('institutional_flow', 'NEUTRAL')
+        dark_pool = data.get('dark_pool_details') or {}
+        current_flow = Flow.of(data) if feat is None else feat.flow
         
         # Get previous flow
-        previous_flow = self.previous_dark_pool_direction.get(symbol, 'NEUTRAL')
+        previous_flow = self.previous_dark_pool_direction.get(symbol, Flow.NEUTRAL)
         
         # Update tracking
-        self.previous_dark_pool_direction[symbol] = current_flow
+        self._remember(self.previous_dark_pool_direction, symbol, current_flow, 'flip_cache_evictions')
         
-        # Check for flip
-        if previous_flow in ['BUYING', 'SELLING'] and current_flow in ['BUYING', 'SELLING']:
-            if previous_flow != current_flow:
-                strength = dark_pool.get('signal_strength', 0)
-                block_value = dark_pool.get('block_trade_value', 0)
-                
-                # Must meet minimum criteria
-                if strength >= 3 and block_value >= self.min_dark_pool_value:
-                    return {
-                        'type': 'dark_pool_flip',
-                        'previous': previous_flow,
-                        'current': current_flow,
-                        'strength': strength,
-                        'block_value': block_value,
-                        'data': data
-                    }
+        # Check for flip (directional flows of opposite sign)
+        if previous_flow * current_flow < 0:
+            strength = dark_pool.get('signal_strength', 0)
+            block_value = dark_pool.get('block_trade_value', 0)
+            
+            # Must meet minimum criteria
+            if strength >= 3 and block_value >= self.min_dark_pool_value:
+                return {
+                    'type': 'dark_pool_flip',
+                    'previous': previous_flow.name,
+                    'current': current_flow.name,
+                    'strength': strength,
+                    'block_value': block_value,
+                    'data': data
+                }
         
         return None
     
-    def check_extreme_setup(self, symbol: str, data: dict) -> Optional[dict]:
+    def check_extreme_setup(self, symbol: str, data: dict,
+                            feat: Optional[SymbolFeatures] = None) -> Optional[dict]:
         """
         TRIGGER 5: Extreme Confluence Setup
         ALL factors perfectly aligned (RARE!)
+        
+        Gates run most-selective first: most symbols have no gamma wall
+        within the urgent band (none at all when options data is unavailable)
         """
-        # Dark Pool: Max strength
-        dark_pool = data.get('dark_pool_details', {})
-        dark_pool_strength = dark_pool.get('signal_strength', 0)
-        if dark_pool_strength < 5:
+        if feat is None:
+            feat = SymbolFeatures.of(data)
+        
+        # Gamma Wall: Very close (999 without a wall)
+        if feat.wall_distance > self.gamma_wall_urgent:
             return None
         
-        # RVOL: Extreme
-        volume_analysis = data.get('volume_analysis', {})
-        rvol = volume_analysis.get('rvol', {}).get('rvol', 0)
-        if rvol < self.extreme_rvol:
+        # Dark Pool: Max strength
+        if feat.strength < 5:
             return None
         
-        # Gamma Wall: Very close
-        open_interest = data.get('open_interest', {})
-        nearest_wall = open_interest.get('nearest_wall')
-        if not nearest_wall or nearest_wall.get('distance_pct', 999) > self.gamma_wall_urgent:
+        # RVOL: Extreme
+        if feat.rvol < self.extreme_rvol:
             return None
         
         # Key Levels: Extreme confluence
-        key_levels = data.get('key_levels', {})
-        confluence = key_levels.get('confluence_score', 0)
-        if confluence < self.extreme_confluence:
+        if feat.confluence < self.extreme_confluence:
             return None
         
         # Volume Spike: Detected
-        spike_data = volume_analysis.get('volume_spike', {})
+        spike_data = data['volume_analysis'].get('volume_spike') or {}
         if not spike_data.get('spike_detected'):
             return None
         
         # ALL FACTORS ALIGNED!
-        flow = dark_pool.get('institutional_flow')
-        direction = 'BUY' if flow == 'BUYING' else 'SELL'
+        direction = 'BUY' if feat.flow == Flow.BUYING else 'SELL'
         
         return {
             'type': 'extreme_setup',
             'direction': direction,
-            'dark_pool_strength': dark_pool_strength,
-            'rvol': rvol,
-            'gamma_wall': nearest_wall,
-            'confluence': confluence,
+            'dark_pool_strength': feat.strength,
+            'rvol': feat.rvol,
+            'gamma_wall': data['open_interest']['nearest_wall'],
+            'confluence': feat.confluence,
             'spike_ratio': spike_data.get('spike_ratio', 0),
             'data': data
         }
@@ -432,287 +870,350 @@ class MomentumSignalMonitor:
     def create_momentum_signal_embed(self, symbol: str, signal: dict) -> dict:
         """Create Discord embed for momentum buy/sell signal"""
         data = signal['data']
-        is_buy = signal['type'] == 'momentum_buy'
-        
-        embed = {
-            'title': f"{'🟢 MOMENTUM BUY SIGNAL' if is_buy else '🔴 MOMENTUM SELL SIGNAL'}: {symbol}",
-            'color': 0x00ff00 if is_buy else 0xff0000,
-            'timestamp': datetime.utcnow().isoformat(),
-            'fields': []
-        }
-        
-        # Factors
-        factors_text = '\n'.join([f"✅ {f}" for f in signal['factors']])
-        embed['fields'].append({
-            'name': f"📊 Factors ({signal['factor_count']}/6)",
-            'value': factors_text,
-            'inline': False
-        })
+        title, color = MOMENTUM_STYLE[signal['type']]
+        dark_pool = data.get('dark_pool_details') or {}
+        entry_targets = data.get('entry_targets') or {}
         
         # Price & Levels
-        dark_pool = data.get('dark_pool_details', {})
-        entry_targets = data.get('entry_targets', {})
-        
-        price_info = f"**Current:** ${data.get('current_price', 0):.2f}\n"
-        price_info += f"**VWAP:** ${data.get('vwap', 0):.2f}\n"
-        
+        price_info = (
+            f"**Current:** ${data.get('current_price', 0):.2f}\n"
+            f"**VWAP:** ${data.get('vwap', 0):.2f}\n"
+        )
         if entry_targets.get('entry'):
-            price_info += f"\n**Entry:** ${entry_targets['entry']:.2f}\n"
-            price_info += f"**Stop:** ${entry_targets['stop_loss']:.2f}\n"
-            price_info += f"**Target:** ${entry_targets['tp1']:.2f}"
-        
-        embed['fields'].append({
-            'name': '💰 Levels',
-            'value': price_info,
-            'inline': True
-        })
+            price_info += (
+                f"\n**Entry:** ${entry_targets['entry']:.2f}\n"
+                f"**Stop:** ${entry_targets['stop_loss']:.2f}\n"
+                f"**Target:** ${entry_targets['tp1']:.2f}"
+            )
         
         # Dark Pool Details
-        dp_info = f"**Flow:** {dark_pool.get('institutional_flow', 'N/A')}\n"
-        dp_info += f"**Activity:** {dark_pool.get('activity', 'N/A')}\n"
         block_value = dark_pool.get('block_trade_value', 0)
-        if block_value > 0:
-            dp_info += f"**Value:** ${block_value/1000000:.1f}M"
-        
-        embed['fields'].append({
-            'name': '🏦 Dark Pool',
-            'value': dp_info,
-            'inline': True
-        })
+        dp_info = (
+            f"**Flow:** {dark_pool.get('institutional_flow', 'N/A')}\n"
+            f"**Activity:** {dark_pool.get('activity', 'N/A')}\n"
+            + (f"**Value:** ${block_value/1000000:.1f}M" if block_value > 0 else '')
+        )
         
-        # Confidence
-        embed['footer'] = {
-            'text': f"⏰ {datetime.now().strftime('%I:%M %p ET')} | Confidence: {signal['confidence']:.0f}%"
+        return {
+            'title': f"{title}: {symbol}",
+            'color': color,
+            'timestamp': self._cycle_timestamp,
+            'fields': [
+                {
+                    'name': f"📊 Factors ({signal['factor_count']}/6)",
+                    'value': '\n'.join(FACTOR_BULLET + factor for factor in signal['factors']),
+                    'inline': False
+                },
+                {'name': '💰 Levels', 'value': price_info, 'inline': True},
+                {'name': '🏦 Dark Pool', 'value': dp_info, 'inline': True}
+            ],
+            'footer': {
+                'text': f"⏰ {self._cycle_footer} | Confidence: {signal['confidence']:.0f}%"
+            }
         }
-        
-        return embed
     
     def create_gamma_approach_embed(self, symbol: str, signal: dict) -> dict:
         """Create Discord embed for gamma wall approach"""
         data = signal['data']
         wall = signal['wall']
+        is_support = wall['type'] == 'support'
         
-        embed = {
+        return {
             'title': f"⚡ GAMMA WALL APPROACH: {symbol}",
             'color': 0xffff00,
-            'timestamp': datetime.utcnow().isoformat(),
-            'fields': []
+            'timestamp': self._cycle_timestamp,
+            'fields': [
+                {
+                    'name': '🎯 Gamma Wall',
+                    'value': (
+                        f"{'🛡️' if is_support else '⚠️'} **${wall['strike']}** ({wall['type'].upper()})\n"
+                        f"**Distance:** {signal['distance']:.1f}%\n"
+                        f"**Current Price:** ${data.get('current_price', 0):.2f}"
+                    ),
+                    'inline': False
+                },
+                {
+                    'name': '✅ Confirmation',
+                    'value': (
+                        f"**RVOL:** {signal['rvol']:.1f}x\n"
+                        f"**Dark Pool:** {signal['flow']}\n"
+                        f"**Urgency:** {signal['urgency']}"
+                    ),
+                    'inline': False
+                },
+                {
+                    'name': '💡 Action',
+                    'value': (
+                        f"🎲 **HIGH probability** {'bounce' if is_support else 'rejection'} at ${wall['strike']}\n"
+                        f"Watch for entry on {'touch' if is_support else 'rejection'}!"
+                    ),
+                    'inline': False
+                }
+            ],
+            'footer': {'text': f"⏰ {self._cycle_footer}"}
         }
-        
-        # Wall Info
-        wall_emoji = '🛡️' if wall['type'] == 'support' else '⚠️'
-        wall_info = f"{wall_emoji} **${wall['strike']}** ({wall['type'].upper()})\n"
-        wall_info += f"**Distance:** {signal['distance']:.1f}%\n"
-        wall_info += f"**Current Price:** ${data.get('current_price', 0):.2f}"
-        
-        embed['fields'].append({
-            'name': '🎯 Gamma Wall',
-            'value': wall_info,
-            'inline': False
-        })
-        
-        # Confirmation
-        confirm_info = f"**RVOL:** {signal['rvol']:.1f}x\n"
-        confirm_info += f"**Dark Pool:** {signal['flow']}\n"
-        confirm_info += f"**Urgency:** {signal['urgency']}"
-        
-        embed['fields'].append({
-            'name': '✅ Confirmation',
-            'value': confirm_info,
-            'inline': False
-        })
-        
-        # Action
-        action = f"🎲 **HIGH probability** {'bounce' if wall['type'] == 'support' else 'rejection'} at ${wall['strike']}\n"
-        action += f"Watch for entry on {'touch' if wall['type'] == 'support' else 'rejection'}!"
-        
-        embed['fields'].append({
-            'name': '💡 Action',
-            'value': action,
-            'inline': False
-        })
-        
-        embed['footer'] = {
-            'text': f"⏰ {datetime.now().strftime('%I:%M %p ET')}"
-        }
-        
-        return embed
     
     def create_dark_pool_flip_embed(self, symbol: str, signal: dict) -> dict:
         """Create Discord embed for dark pool direction change"""
-        data = signal['data']
-        
-        embed = {
-            'title': f"🔄 DARK POOL DIRECTION CHANGE: {symbol}",
-            'color': 0xff6600,
-            'timestamp': datetime.utcnow().isoformat(),
-            'fields': []
-        }
-        
-        # Direction Change
-        change_info = f"⚠️ **{signal['previous']} → {signal['current']}**\n"
-        change_info += f"**Strength:** {'█' * signal['strength']}\n"
-        block_value = signal['block_value']
-        change_info += f"**Block Value:** ${block_value/1000000:.1f}M"
-        
-        embed['fields'].append({
-            'name': '🔄 Flow Change',
-            'value': change_info,
-            'inline': False
-        })
-        
-        # Action
         if signal['current'] == 'SELLING':
-            action = "🚨 **ACTION: EXIT LONGS IMMEDIATELY**\n"
-            action += "This is a REVERSAL signal!"
+            action = "🚨 **ACTION: EXIT LONGS IMMEDIATELY**\nThis is a REVERSAL signal!"
         else:
-            action = "✅ **ACTION: EXIT SHORTS / PREPARE LONGS**\n"
-            action += "Institutional flow reversed bullish!"
-        
-        embed['fields'].append({
-            'name': '💡 Action',
-            'value': action,
-            'inline': False
-        })
+            action = "✅ **ACTION: EXIT SHORTS / PREPARE LONGS**\nInstitutional flow reversed bullish!"
         
-        embed['footer'] = {
-            'text': f"⏰ {datetime.now().strftime('%I:%M %p ET')} | Changed in last check"
+        return {
+            'title': f"🔄 DARK POOL DIRECTION CHANGE: {symbol}",
+            'color': 0xff6600,
+            'timestamp': self._cycle_timestamp,
+            'fields': [
+                {
+                    'name': '🔄 Flow Change',
+                    'value': (
+                        f"⚠️ **{signal['previous']} → {signal['current']}**\n"
+                        f"**Strength:** {'█' * signal['strength']}\n"
+                        f"**Block Value:** ${signal['block_value']/1000000:.1f}M"
+                    ),
+                    'inline': False
+                },
+                {'name': '💡 Action', 'value': action, 'inline': False}
+            ],
+            'footer': {'text': f"⏰ {self._cycle_footer} | Changed in last check"}
         }
-        
-        return embed
     
     def create_extreme_setup_embed(self, symbol: str, signal: dict) -> dict:
         """Create Discord embed for extreme confluence setup"""
-        data = signal['data']
         wall = signal['gamma_wall']
-        entry_targets = data.get('entry_targets', {})
-        
-        embed = {
-            'title': f"🔥🔥🔥 EXTREME SETUP: {symbol} 🔥🔥🔥",
-            'description': '💎 **HIGHEST CONVICTION SIGNAL**',
-            'color': 0xff00ff,
-            'timestamp': datetime.utcnow().isoformat(),
-            'fields': []
-        }
+        entry_targets = signal['data'].get('entry_targets') or {}
         
         # All Factors
-        factors = f"**Dark Pool:** {'█' * signal['dark_pool_strength']} (HEAVY)\n"
-        factors += f"**RVOL:** {signal['rvol']:.1f}x (EXTREME)\n"
-        factors += f"**Spike:** {signal['spike_ratio']:.1f}x 🚀\n"
-        factors += f"**Gamma Wall:** ${wall['strike']} ({wall['distance_pct']:.1f}% away)\n"
-        factors += f"**Confluence:** {signal['confluence']}/10"
-        
-        embed['fields'].append({
+        fields = [{
             'name': '🎯 Perfect Alignment',
-            'value': factors,
+            'value': (
+                f"**Dark Pool:** {'█' * signal['dark_pool_strength']} (HEAVY)\n"
+                f"**RVOL:** {signal['rvol']:.1f}x (EXTREME)\n"
+                f"**Spike:** {signal['spike_ratio']:.1f}x 🚀\n"
+                f"**Gamma Wall:** ${wall['strike']} ({wall['distance_pct']:.1f}% away)\n"
+                f"**Confluence:** {signal['confluence']}/10"
+            ),
             'inline': False
-        })
+        }]
         
         # Entry Plan
         if entry_targets.get('entry'):
-            entry_info = f"**{signal['direction']} ZONE:** ${entry_targets['entry']:.2f}\n"
-            entry_info += f"**STOP:** ${entry_targets['stop_loss']:.2f}\n"
-            entry_info += f"**TARGET 1:** ${entry_targets['tp1']:.2f}\n"
-            entry_info += f"**TARGET 2:** ${entry_targets.get('tp2', 0):.2f}\n"
-            entry_info += f"\n**R/R:** {entry_targets.get('risk_reward', 0):.1f}:1"
-            
-            embed['fields'].append({
+            fields.append({
                 'name': '📈 Trade Plan',
-                'value': entry_info,
+                'value': (
+                    f"**{signal['direction']} ZONE:** ${entry_targets['entry']:.2f}\n"
+                    f"**STOP:** ${entry_targets['stop_loss']:.2f}\n"
+                    f"**TARGET 1:** ${entry_targets['tp1']:.2f}\n"
+                    f"**TARGET 2:** ${entry_targets.get('tp2', 0):.2f}\n"
+                    f"\n**R/R:** {entry_targets.get('risk_reward', 0):.1f}:1"
+                ),
                 'inline': False
             })
         
         # Warning
-        embed['fields'].append({
+        fields.append({
             'name': '🚀 HIGH PRIORITY',
             'value': '**THIS IS A RARE SETUP - MAXIMUM CONVICTION!**',
             'inline': False
         })
         
-        embed['footer'] = {
-            'text': f"⏰ {datetime.now().strftime('%I:%M %p ET')} | Confidence: 97%"
+        return {
+            'title': f"🔥🔥🔥 EXTREME SETUP: {symbol} 🔥🔥🔥",
+            'description': '💎 **HIGHEST CONVICTION SIGNAL**',
+            'color': 0xff00ff,
+            'timestamp': self._cycle_timestamp,
+            'fields': fields,
+            'footer': {'text': f"⏰ {self._cycle_footer} | Confidence: 97%"}
         }
-        
-        return embed
     
-    def check_symbol(self, symbol: str):
-        """Check a single symbol for momentum signals"""
+    def get_signal(self, symbol: str) -> dict:
+        """Full analyzer signal for symbol, reused for signal_ttl seconds"""
+        cached_at, data = self._signal_cache.get(symbol, (0.0, None))
+        if data is not None and time.monotonic() - cached_at < self.signal_ttl:
+            return data
+        
+        data = self.analyzer.generate_professional_signal(symbol)
+        
+        # A signal built after the request budget ran out is missing sections; don't reuse it
+        if not self.analyzer.deadline_exceeded():
+            self._remember(self._signal_cache, symbol, (time.monotonic(), data))
+        return data
+    
+    def _remember(self, cache: OrderedDict, symbol: str, value, eviction_stat: str = None):
+        """Store per-symbol state, evicting the least recently updated symbols"""
+        with self._state_lock:
+            cache[symbol] = value
+            cache.move_to_end(symbol)
+            while len(cache) > self.max_tracked_symbols:
+                cache.popitem(last=False)
+                if eviction_stat:
+                    self.stats[eviction_stat] += 1
+    
+    def _prepare_symbol(self, symbol: str) -> Optional[dict]:
+        """Fetch the analyzer signal for symbol, or None if it can't alert this cycle"""
         try:
-            # Get full analysis
-            data = self.analyzer.generate_professional_signal(symbol)
+            # Get full analysis; its Polygon requests share the per-symbol budget,
+            # so a slow symbol gives its pool worker back instead of holding it
+            with self.analyzer.request_deadline(self.per_symbol_timeout):
+                data = self.get_signal(symbol)
+                partial = self.analyzer.deadline_exceeded()
+            
+            # Sections requested after the budget ran out came back empty; triggers
+            # would alert or record flip state from missing data, so sit this cycle out
+            if partial:
+                self._increment_stat('timeouts')
+                self.logger.debug("⏱️ %s ran out of its %ss request budget, skipped this cycle",
+                                  symbol, self.per_symbol_timeout)
+                return None
             
             if data.get('error'):
-                return
+                return None
             
             # Filter by price
             if data.get('current_price', 0) < self.min_price:
-                return
-            
-            # Check all triggers
-            
-            # Trigger 5: Extreme Setup (check first - highest priority)
-            extreme = self.check_extreme_setup(symbol, data)
-            if extreme and self.can_alert(symbol, 'extreme_setup'):
-                embed = self.create_extreme_setup_embed(symbol, extreme)
-                if self.send_discord_alert(embed):
-                    self.mark_alerted(symbol, 'extreme_setup')
-                    self.stats['extreme_setups'] += 1
-                    self.logger.info(f"🔥 EXTREME SETUP ALERT: {symbol}")
-                return  # Don't check other triggers if extreme detected
-            
-            # Trigger 4: Dark Pool Flip (check second - time sensitive)
-            flip = self.check_dark_pool_flip(symbol, data)
-            if flip and self.can_alert(symbol, 'dark_pool_flip'):
-                embed = self.create_dark_pool_flip_embed(symbol, flip)
-                if self.send_discord_alert(embed):
-                    self.mark_alerted(symbol, 'dark_pool_flip')
-                    self.stats['dark_pool_flips'] += 1
-                    self.logger.info(f"🔄 DARK POOL FLIP ALERT: {symbol} ({flip['previous']} → {flip['current']})")
+                return None
             
-            # Trigger 3: Gamma Wall Approach
-            gamma = self.check_gamma_wall_approach(symbol, data)
-            if gamma and self.can_alert(symbol, 'gamma_approach'):
-                embed = self.create_gamma_approach_embed(symbol, gamma)
-                if self.send_discord_alert(embed):
-                    self.mark_alerted(symbol, 'gamma_approach')
-                    self.stats['gamma_approaches'] += 1
-                    self.logger.info(f"⚡ GAMMA APPROACH ALERT: {symbol} (${gamma['wall']['strike']})")
-            
-            # Trigger 1: Momentum Buy Signal
-            buy_signal = self.check_momentum_buy_signal(symbol, data)
-            if buy_signal and self.can_alert(symbol, 'momentum_signal'):
-                embed = self.create_momentum_signal_embed(symbol, buy_signal)
-                if self.send_discord_alert(embed):
-                    self.mark_alerted(symbol, 'momentum_signal')
-                    self.stats['momentum_buy_signals'] += 1
-                    self.logger.info(f"🟢 MOMENTUM BUY ALERT: {symbol} ({buy_signal['factor_count']} factors)")
-            
-            # Trigger 2: Momentum Sell Signal
-            sell_signal = self.check_momentum_sell_signal(symbol, data)
-            if sell_signal and self.can_alert(symbol, 'momentum_signal'):
-                embed = self.create_momentum_signal_embed(symbol, sell_signal)
-                if self.send_discord_alert(embed):
-                    self.mark_alerted(symbol, 'momentum_signal')
-                    self.stats['momentum_sell_signals'] += 1
-                    self.logger.info(f"🔴 MOMENTUM SELL ALERT: {symbol} ({sell_signal['factor_count']} factors)")
+            return data
             
-            # FEATURE #5: Confluence Alert (75%+ confidence)
-            confluence = self.check_confluence_alert(symbol, data)
-            if confluence and self.can_alert(symbol, 'confluence_alert'):
-                embed = self.create_confluence_embed(symbol, confluence)
-                if self.send_discord_alert(embed):
-                    self.mark_alerted(symbol, 'confluence_alert')
-                    self.stats['total_alerts_sent'] += 1
-                    priority = confluence['confluence']['priority']
-                    confidence = confluence['confluence']['confidence']
-                    self.logger.info(f"🎯 CONFLUENCE ALERT: {symbol} ({confidence:.0f}% - {priority})")
+        except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+            self.logger.error("Error checking %s: %s", symbol, e)
+            return None
+    
+    def _fetch_symbols(self, symbols: list) -> list:
+        """Prepare symbols on the scan pool, returns (symbol, data, features) ready for triggers
+        
+        Each wave of free workers gets per_symbol_timeout seconds, so the whole fetch is
+        bounded by per_symbol_timeout * ceil(N / free workers). Workers still finishing
+        an earlier timed-out fetch aren't counted as free.
+        """
+        self._overdue = {future for future in self._overdue if not future.done()}
+        free_workers = max(1, self.max_concurrent_symbols - len(self._overdue))
+        
+        futures = [(symbol, self._scan_pool.submit(self._prepare_symbol, symbol)) for symbol in symbols]
+        waves = -(-len(symbols) // free_workers)
+        deadline = time.monotonic() + self.per_symbol_timeout * waves
+        
+        ready = []
+        for symbol, future in futures:
+            try:
+                data = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeout:
+                if not future.cancel():
+                    self._overdue.add(future)
+                with self._state_lock:
+                    self.stats['timeouts'] += 1
+                if symbol not in self._slow_symbols:
+                    self._slow_symbols.add(symbol)
+                    self.logger.warning("⏱️ %s exceeded the %ss fetch budget, skipped this cycle",
+                                        symbol, self.per_symbol_timeout)
+                continue
+            except Exception:
+                # Unexpected analyzer failures keep their traceback but don't end the cycle
+                self.logger.exception("Unexpected error checking %s", symbol)
+                continue
+            
+            self._slow_symbols.discard(symbol)
+            if data is None:
+                continue
+            
+            try:
+                ready.append((symbol, data, SymbolFeatures.of(data)))
+            except (AttributeError, TypeError, ValueError) as e:
+                self.logger.error("Error checking %s: %s", symbol, e)
+        
+        return ready
+    
+    def _run_triggers(self, symbol: str, data: dict, feat: SymbolFeatures,
+                      skip: frozenset = frozenset(), now: float = None):
+        """Run triggers in priority order, except alert types in skip"""
+        # Without a Discord destination (log-only runs) checkers still update
+        # their state, but no embed is built
+        delivering = bool(self.discord_alerter or self.discord_webhook)
+        
+        try:
+            for checker, builder, alert_type, outcomes, exclusive, stateful in self._triggers:
+                if alert_type in skip:
+                    continue
+                
+                # Cooling down: skip the check itself unless it tracks state between cycles
+                if not stateful and not self.can_alert(symbol, alert_type, now):
+                    continue
+                
+                result = checker(symbol, data, feat)
+                signals = result if isinstance(result, tuple) else (result,)
+                
+                for signal, (stat_key, log_line) in zip(signals, outcomes):
+                    if not signal or not self.can_alert(symbol, alert_type, now):
+                        continue
+                    
+                    if delivering and self.send_discord_alert(builder(symbol, signal), symbol, alert_type):
+                        if stat_key:
+                            self._increment_stat(stat_key)
+                        self.logger.info(log_line.format(symbol=symbol, signal=signal))
+                    
+                    if exclusive:
+                        return  # Don't check other triggers
             
         except Exception as e:
-            self.logger.error(f"Error checking {symbol}: {str(e)}")
+            self.logger.error("Error checking %s: %s", symbol, e)
+    
+    def check_symbol(self, symbol: str):
+        """Check a single symbol for momentum signals"""
+        if not self._alertable(symbol, time.monotonic()):
+            return
+        
+        data = self._prepare_symbol(symbol)
+        if data is not None:
+            self._run_triggers(symbol, data, SymbolFeatures.of(data))
+    
+    def _prescreen(self, features: list) -> list:
+        """
+        Evaluate the numeric trigger gates for every symbol at once
+        
+        Returns, per symbol, the alert types that can't fire (momentum: neither
+        side reaches 4 factors; gamma approach / extreme setup: a threshold
+        fails), so their checks and factor text only run where they might.
+        """
+        (flow, strength, rvol, wall_side, wall_distance, at_support, at_resistance,
+         confluence, price, vwap, sentiment) = np.array(
+            features, dtype=float
+        ).reshape(len(features), 11).T
+        
+        dark_pool_ok = strength >= self.min_dark_pool_strength
+        rvol_ok = rvol >= self.min_rvol
+        wall_near = wall_distance <= self.gamma_wall_distance
+        confluence_ok = confluence >= self.min_confluence
+        
+        # Triggers 1 & 2: either side can reach 4 of the 6 factors
+        buy_factors = (
+            ((flow > 0) & dark_pool_ok).astype(np.int8) + rvol_ok + ((wall_side > 0) & wall_near)
+            + ((at_support > 0) & confluence_ok) + (price < vwap) + (sentiment > 0)
+        )
+        sell_factors = (
+            ((flow < 0) & dark_pool_ok).astype(np.int8) + rvol_ok + ((wall_side < 0) & wall_near)
+            + ((at_resistance > 0) & confluence_ok) + (price > vwap) + (sentiment < 0)
+        )
+        momentum_possible = (buy_factors >= 4) | (sell_factors >= 4)
+        
+        # Trigger 3: wall in range, high RVOL, flow agrees with a support/resistance wall
+        gamma_possible = wall_near & (rvol >= self.high_rvol) & ((wall_side == 0) | (wall_side * flow > 0))
+        
+        # Trigger 5: every numeric gate (the volume spike is left to the check)
+        extreme_possible = (
+            (wall_distance <= self.gamma_wall_urgent) & (strength >= 5)
+            & (rvol >= self.extreme_rvol) & (confluence >= self.extreme_confluence)
+        )
+        
+        skip_codes = (
+            (~momentum_possible).astype(np.int8) + 2 * ~gamma_possible + 4 * ~extreme_possible
+        )
+        return [PRESCREEN_SKIPS[code] for code in skip_codes.tolist()]
     
     def run_single_check(self) -> int:
-        """Run a single check cycle, returns number of alerts sent"""
-        alerts_before = self.stats['total_alerts_sent']
+        """Run a single check cycle, returns number of alerts queued for Discord"""
+        alerts_before = self._alerts_queued
+        self._stamp_cycle()
         
         try:
             # Get watchlist
@@ -721,63 +1222,126 @@ class MomentumSignalMonitor:
             else:
                 symbols = ['SPY', 'QQQ', 'NVDA', 'TSLA', 'AAPL']
             
-            self.logger.info(f"🔍 Checking {len(symbols)} symbols for momentum signals...")
+            self.logger.info("🔍 Checking %d symbols for momentum signals...", len(symbols))
+            
+            # Fetch signals concurrently; duplicates are dropped so no symbol's
+            # state is shared by two workers
+            symbols = list(dict.fromkeys(symbols))
+            self._watched_symbols = symbols
+            
+            # Skip the analyzer entirely for symbols no trigger could alert on
+            now = time.monotonic()
+            eligible = [symbol for symbol in symbols if self._alertable(symbol, now)]
             
-            # Check each symbol
-            for symbol in symbols:
-                self.check_symbol(symbol)
+            ready = self._fetch_symbols(eligible)
+            
+            if ready:
+                # Evaluate trigger gates across the whole watchlist in one pass
+                try:
+                    skips = self._prescreen([feat for _, _, feat in ready])
+                except Exception as e:
+                    self.logger.error("Trigger prescreen failed: %s", e)
+                    skips = [PRESCREEN_SKIPS[0]] * len(ready)
+                
+                for (symbol, data, feat), skip in zip(ready, skips):
+                    self._run_triggers(symbol, data, feat, skip, now)
             
             self.stats['total_checks'] += 1
             
         except Exception as e:
-            self.logger.error(f"Error in check cycle: {str(e)}")
+            self.logger.error("Error in check cycle: %s", e)
         
-        return self.stats['total_alerts_sent'] - alerts_before
+        return self._alerts_queued - alerts_before
     
     def run_continuous(self):
         """Run continuous monitoring loop"""
         self.logger.info("🚀 Starting Momentum Signal Monitor...")
-        self.logger.info(f"   Market Hours Only: {self.market_hours_only}")
+        self.logger.info("   Market Hours Only: %s", self.market_hours_only)
         
-        while self.enabled:
+        # SIGTERM (supervisord / docker stop) ends the loop like stop() instead of
+        # killing it mid-cycle; handlers can only be installed from the main thread
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: self._stop_event.set())
+        
+        self._stop_event.clear()
+        while self.enabled and not self._stop_event.is_set():
             try:
+                cycle_start = time.monotonic()
+                
                 # Reset daily counters if needed
                 self.reset_daily_counters()
                 
                 # Check if should run
                 if self.market_hours_only and not self.is_market_hours():
-                    self.logger.debug("Outside market hours, skipping check")
-                    time.sleep(60)
+                    # Sleep toward the next open (capped so config changes are still noticed)
+                    until_open = self._market_open_ts - time.time()
+                    self.logger.debug("Outside market hours, next open in %.0f min", until_open / 60)
+                    self._stop_event.wait(min(max(until_open, 1.0), 900))
                     continue
                 
                 # Run check
                 alerts_sent = self.run_single_check()
+                self._error_backoff = 1
                 
                 if alerts_sent > 0:
-                    self.logger.info(f"✅ Sent {alerts_sent} alerts in this cycle")
+                    self.logger.info("✅ Sent %d alerts in this cycle", alerts_sent)
                 
-                # Sleep until next check
-                time.sleep(self.check_interval)
+                # Wait out the rest of the interval (scan time counts toward it), or
+                # longer if every symbol is still cooling down; stop() wakes the wait
+                elapsed = time.monotonic() - cycle_start
+                idle = min(self.seconds_until_alertable(self._watched_symbols), self.max_idle_seconds)
+                self._stop_event.wait(max(0.0, self.check_interval - elapsed, idle))
                 
             except KeyboardInterrupt:
                 self.logger.info("Momentum Signal Monitor stopped by user")
                 break
             except Exception as e:
-                self.logger.error(f"Error in monitoring loop: {str(e)}")
-                time.sleep(60)
+                delay = min(300, self._error_backoff)
+                self._error_backoff = delay * 2
+                self.logger.error("Error in monitoring loop: %s (retrying in %ss)", e, delay)
+                self._stop_event.wait(delay + random.uniform(0, delay * 0.1))
+    
+    def stop(self):
+        """Stop the continuous loop without waiting out the current sleep"""
+        self._stop_event.set()
+        self.logger.info("Momentum Signal Monitor stopped")
+    
+    def shutdown(self):
+        """Stop monitoring, deliver queued alerts, then release pooled connections and workers"""
+        self.stop()
+        self.drain_alerts()
+        self._scan_pool.shutdown(wait=True)
+        self.http.close()
+        # Shared with other monitors; its session closes with the last holder
+        if self._analyzer_held:
+            self._analyzer_held = False
+            release_shared_analyzer(self.analyzer)
+        if self._alert_db is not None:
+            self._alert_db.close()
+            self._alert_db = None
 
 
     # ========================================================================
     # FEATURE #5: CONFLUENCE ALERT METHODS
     # ========================================================================
     
-    def check_confluence_alert(self, symbol: str, data: Dict) -> Optional[Dict]:
+    def check_confluence_alert(self, symbol: str, data: Dict,
+                               feat: Optional[SymbolFeatures] = None) -> Optional[Dict]:
         """
         Check if confluence alert should be sent (75%+ confidence)
         
         Returns confluence analysis if should alert, None otherwise
         """
         try:
+            # Skip stale or priceless data before the full analysis
+            if not data.get('current_price') or self._data_age(data) > self.max_data_age:
+                return None
+            
+            # Check cooldown first - it's a dict lookup, the analysis is not
+            alert_type = 'confluence_alert'
+            if not self.confluence_system.check_cooldown(symbol, alert_type):
+                return None
+            
             # Analyze confluence
             confluence_result = self.confluence_system.analyze_confluence(symbol, data)
             
@@ -790,20 +1354,23 @@ class MomentumSignalMonitor:
             if not confluence_data['should_alert']:
                 return None
             
-            # Check cooldown (use same as momentum_signal)
-            alert_type = 'confluence_alert'
-            if not self.confluence_system.check_cooldown(symbol, alert_type):
-                return None
-            
             # Mark as sent
             self.confluence_system.mark_alert_sent(symbol, alert_type)
             
             return confluence_result
             
         except Exception as e:
-            self.logger.error(f"Error checking confluence for {symbol}: {str(e)}")
+            self.logger.error("Error checking confluence for %s: %s", symbol, e)
             return None
     
+    @staticmethod
+    def _data_age(data: Dict) -> float:
+        """Seconds since the analyzer generated data (inf without a valid timestamp)"""
+        try:
+            return time.time() - datetime.fromisoformat(data['timestamp']).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return float('inf')
+    
     def create_confluence_embed(self, symbol: str, confluence_result: Dict) -> dict:
         """Create Discord embed for confluence alert"""
         
@@ -815,69 +1382,28 @@ class MomentumSignalMonitor:
         signals = confluence_result['active_signals']
         current_price = confluence_result['current_price']
         targets = confluence_result.get('targets', {})
+        n_active = len(signals)
+        n_total = len(confluence_result['all_signals'])
         
-        # Determine color based on priority
-        if priority == 'EXTREME':
-            color = 0xFF0000  # Red - Extreme
-            emoji = '🔥🔥🔥'
-        elif priority == 'HIGH':
-            color = 0xFF6600  # Orange - High
-            emoji = '🔥🔥'
-        else:
-            color = 0xFFD700  # Gold - Medium
-            emoji = '🔥'
-        
-        # Direction emoji
-        dir_emoji = '📈' if direction == 'BULLISH' else '📉'
-        
-        embed = {
-            'title': f"{emoji} {priority} CONFLUENCE - {symbol}",
-            'description': f"**{confidence:.0f}% Confidence** {dir_emoji} {direction} {setup_type}",
-            'color': color,
-            'timestamp': datetime.utcnow().isoformat(),
-            'fields': []
-        }
-        
-        # Current price
-        embed['fields'].append({
-            'name': '💰 Current Price',
-            'value': f"**${current_price:.2f}**",
-            'inline': True
-        })
-        
-        # Signals count
-        embed['fields'].append({
-            'name': '✅ Signals Aligned',
-            'value': f"**{len(signals)}/{len(confluence_result['all_signals'])}** factors",
-            'inline': True
-        })
-        
-        # Priority
-        embed['fields'].append({
-            'name': '⚡ Priority',
-            'value': f"**{priority}**",
-            'inline': True
-        })
+        # Color / emoji by priority and direction
+        color, emoji = CONFLUENCE_PRIORITY_STYLE.get(priority, CONFLUENCE_PRIORITY_STYLE['MEDIUM'])
+        dir_emoji = DIRECTION_EMOJI.get(direction, '📉')
         
         # Active signals breakdown
-        signals_text = ""
-        for signal in signals:
-            name = signal['name'].replace('_', ' ').title()
-            strength_pct = int(signal['strength'] * 100)
-            reason = signal['reason']
-            
-            if signal['direction'] == 'BULLISH':
-                emoji_dir = '🟢'
-            else:
-                emoji_dir = '🔴'
-            
-            signals_text += f"{emoji_dir} **{name}** ({strength_pct}%)\n└─ {reason}\n\n"
+        signals_text = "\n\n".join(
+            f"{SIGNAL_DIRECTION_EMOJI.get(signal['direction'], '🔴')} "
+            f"**{signal_display_name(signal['name'])}** ({int(signal['strength'] * 100)}%)\n"
+            f"└─ {signal['reason']}"
+            for signal in signals
+        )
         
-        embed['fields'].append({
-            'name': '📊 Active Signals',
-            'value': signals_text.strip(),
-            'inline': False
-        })
+        # Price, signals aligned, priority and signal breakdown are always present
+        fields = [
+            {'name': '💰 Current Price', 'value': f"**${current_price:.2f}**", 'inline': True},
+            {'name': '✅ Signals Aligned', 'value': f"**{n_active}/{n_total}** factors", 'inline': True},
+            {'name': '⚡ Priority', 'value': f"**{priority}**", 'inline': True},
+            {'name': '📊 Active Signals', 'value': signals_text, 'inline': False}
+        ]
         
         # Targets (if available)
         if targets.get('entry'):
@@ -888,7 +1414,7 @@ class MomentumSignalMonitor:
                 f"**Stop:** ${targets['stop_loss']:.2f}\n"
                 f"**R:R:** {targets.get('risk_reward', 0):.1f}"
             )
-            embed['fields'].append({
+            fields.append({
                 'name': '🎯 Targets',
                 'value': targets_text,
                 'inline': False
@@ -898,44 +1424,55 @@ class MomentumSignalMonitor:
         interpretation = confluence_result.get('interpretation', '')
         if interpretation:
             # Truncate if too long
-            if len(interpretation) > 500:
-                interpretation = interpretation[:497] + "..."
+            if len(interpretation) > MAX_INTERPRETATION_CHARS:
+                interpretation = f"{interpretation[:MAX_INTERPRETATION_CHARS - 3]}..."
             
-            embed['fields'].append({
+            fields.append({
                 'name': '💡 Analysis',
                 'value': interpretation,
                 'inline': False
             })
         
-        # Footer
-        embed['footer'] = {
-            'text': f'Confluence Alert System • {priority} • {datetime.now().strftime("%H:%M:%S ET")}'
+        return {
+            'title': f"{emoji} {priority} CONFLUENCE - {symbol}",
+            'description': f"**{confidence:.0f}% Confidence** {dir_emoji} {direction} {setup_type}",
+            'color': color,
+            'timestamp': self._cycle_timestamp,
+            'fields': fields,
+            'footer': {'text': f'Confluence Alert System • {priority} • {self._cycle_clock}'}
         }
-        
-        return embed
 
 
 # CLI Testing
 if __name__ == '__main__':
     import os
-    from dotenv import load_dotenv
-    import yaml
     from utils.watchlist_manager import WatchlistManager
     
-    load_dotenv()
-    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    API_KEY = os.getenv('POLYGON_API_KEY')
-    WEBHOOK = os.getenv('DISCORD_MOMENTUM_SIGNALS')
+    # Precompiled by compile_monitor_config.py - skips YAML/dotenv parsing
+    from compile_monitor_config import load_compiled_config
     
-    # Load config
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    compiled = load_compiled_config()
+    if compiled:
+        config, ENV = compiled
+        API_KEY = ENV.get('POLYGON_API_KEY')
+        WEBHOOK = ENV.get('DISCORD_MOMENTUM_SIGNALS')
+    else:
+        from dotenv import load_dotenv
+        import yaml
+        
+        load_dotenv()
+        API_KEY = os.getenv('POLYGON_API_KEY')
+        WEBHOOK = os.getenv('DISCORD_MOMENTUM_SIGNALS')
+        
+        # Load config (LibYAML's C loader when PyYAML was built with it)
+        config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
+        with open(config_path, 'r') as f:
+            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
     
     # Initialize
     watchlist_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'watchlist.txt')
@@ -960,6 +1497,7 @@ if __name__ == '__main__':
     print("=" * 80)
     
     alerts = monitor.run_single_check()
+    monitor.shutdown()
     
     print("\n" + "=" * 80)
     print(f"RESULTS: {alerts} alerts sent")
@@ -9,19 +9,25 @@ Routes to: DISCORD_ODTE_LEVELS webhook
 """
 
 import sys
+import os
 from pathlib import Path
 
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 import logging
+import threading
 import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import pytz
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
-from analyzers.enhanced_professional_analyzer import EnhancedProfessionalAnalyzer
+from analyzers.enhanced_professional_analyzer import get_shared_analyzer, release_shared_analyzer
 from analyzers.pin_probability_calculator import PinProbabilityCalculator
 
 
@@ -44,12 +50,15 @@ class ODTEGammaMonitor:
         tradier_api_key = config.get('tradier_api_key')
         tradier_account_type = config.get('tradier_account_type', 'sandbox')
         
-        self.analyzer = EnhancedProfessionalAnalyzer(
-            polygon_api_key=polygon_api_key,
+        self.analyzer = get_shared_analyzer(
+            polygon_api_key,
             tradier_api_key=tradier_api_key,
-            tradier_account_type=tradier_account_type,
-            debug_mode=False
+            tradier_account_type=tradier_account_type
         )
+        self._analyzer_held = True
+        
+        # Set by stop(); wakes the continuous loop's sleep
+        self._stop_event = threading.Event()
         
         # Initialize Pin Probability Calculator
         self.pin_calculator = PinProbabilityCalculator()
@@ -83,8 +92,20 @@ class ODTEGammaMonitor:
         # Watchlist only
         self.watchlist_only = odte_config.get('watchlist_only', True)
         
-        # Discord webhook
+        # Discord webhook, posted to over a pooled keep-alive session
         self.discord_webhook = None
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset({'POST'}),
+                respect_retry_after_header=False
+            )
+        ))
         
         # Tracking
         self.alerted_today = set()  # Track which symbols we've alerted today
@@ -98,6 +119,26 @@ class ODTEGammaMonitor:
             'proximity_matches': 0,
             'errors': 0
         }
+        self._stats_lock = threading.Lock()
+        
+        # Concurrent symbol scans - quote/OI/chain calls are blocking I/O, so a
+        # bounded thread pool overlaps them. In-flight Polygon requests are capped by
+        # the shared analyzer across this pool and the momentum monitor's
+        self.max_concurrent_symbols = odte_config.get(
+            'max_concurrent_symbols', min(16, (os.cpu_count() or 4) * 4)
+        )
+        self._scan_pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_symbols,
+            thread_name_prefix='ODTEScan'
+        )
+        
+        # Gamma wall analysis reuse: symbol -> (monotonic time, price, gamma_data).
+        # Open interest barely moves between scans, so an entry is reused while price
+        # stays within the band (default: the wall proximity tolerance) of the price it
+        # was analyzed at, with level distances re-measured from the current price
+        self.gamma_cache_seconds = odte_config.get('gamma_cache_seconds', 300)
+        self.gamma_cache_band_pct = odte_config.get('gamma_cache_band_pct', self.min_proximity_pct)
+        self._gamma_cache = {}
         
         self.enabled = odte_config.get('enabled', True)
         
@@ -107,6 +148,11 @@ class ODTEGammaMonitor:
         self.logger.info(f"   ⏱️ Alert window: {self.alert_window_minutes} minutes")
         self.logger.info(f"   📅 Weekdays only: {self.weekdays_only}")
     
+    def _bump_stat(self, name: str):
+        """Increment a stats counter (called from scan pool workers)"""
+        with self._stats_lock:
+            self.stats[name] += 1
+    
     def set_discord_webhook(self, webhook_url: str):
         """Set Discord webhook URL"""
         self.discord_webhook = webhook_url
@@ -145,41 +191,76 @@ class ODTEGammaMonitor:
             self.last_alert_date = today
             self.logger.info(f"🔄 Daily tracking reset for {today}")
     
-    def check_odte_exists(self, symbol: str) -> tuple[bool, Optional[Dict]]:
+    def check_odte_exists(self, symbol: str, current_price: Optional[float] = None) -> tuple[bool, Optional[Dict], float]:
         """
         Check if 0DTE options exist for this symbol today
         
+        Args:
+            symbol: Stock symbol
+            current_price: Prefetched price (fetched here if not provided)
+        
         Returns:
-            (exists, gamma_data) - gamma_data includes expiration info
+            (exists, gamma_data, current_price) - gamma_data includes expiration info
         """
         try:
             # Get current price
-            quote = self.analyzer.get_real_time_quote(symbol)
-            current_price = quote['price']
+            if not current_price:
+                quote = self.analyzer.get_real_time_quote(symbol)
+                current_price = quote['price']
             
             if current_price == 0:
-                return False, None
+                return False, None, 0
             
             # Get gamma wall analysis (uses Tradier if available)
-            gamma_data = self.analyzer.analyze_open_interest(symbol, current_price)
+            gamma_data = self.get_gamma_data(symbol, current_price)
             
             if not gamma_data.get('available'):
-                return False, None
+                return False, None, current_price
             
             # Check if options expire TODAY (0DTE)
             expires_today = gamma_data.get('expires_today', False)
             
             if not expires_today:
                 self.logger.debug(f"{symbol}: No 0DTE options (expires: {gamma_data.get('expiration', 'unknown')})")
-                return False, None
+                return False, None, current_price
             
-            self.stats['odte_found'] += 1
-            return True, gamma_data
+            self._bump_stat('odte_found')
+            return True, gamma_data, current_price
             
         except Exception as e:
             self.logger.error(f"Error checking 0DTE for {symbol}: {str(e)}")
-            self.stats['errors'] += 1
-            return False, None
+            self._bump_stat('errors')
+            return False, None, 0
+    
+    def get_gamma_data(self, symbol: str, current_price: float) -> Dict:
+        """Open interest / gamma wall analysis, reused for gamma_cache_seconds within the price band"""
+        cached_at, cached_price, gamma_data = self._gamma_cache.get(symbol, (0.0, None, None))
+        if (cached_price and time.monotonic() - cached_at < self.gamma_cache_seconds
+                and abs(current_price - cached_price) / cached_price * 100 <= self.gamma_cache_band_pct):
+            return self._reprice_gamma_data(gamma_data, current_price)
+        
+        gamma_data = self.analyzer.analyze_open_interest(symbol, current_price)
+        
+        # Failed analyses aren't kept so the next check retries them
+        if gamma_data.get('available'):
+            self._gamma_cache[symbol] = (time.monotonic(), current_price, gamma_data)
+        return gamma_data
+    
+    @staticmethod
+    def _reprice_gamma_data(gamma_data: Dict, current_price: float) -> Dict:
+        """Copy of a cached analysis with each level's distance and side measured from current_price"""
+        gamma_levels = []
+        for level in gamma_data.get('gamma_levels', []):
+            strike = level['strike']
+            distance = strike - current_price
+            gamma_levels.append({
+                **level,
+                'type': 'RESISTANCE' if strike > current_price else 'SUPPORT',
+                'distance_pct': round(distance / current_price * 100, 2),
+                'distance_dollars': round(distance, 2),
+                'direction': '⬆️' if strike > current_price else '⬇️'
+            })
+        return {**gamma_data, 'current_price': current_price, 'gamma_levels': gamma_levels}
     
     def check_proximity_to_gamma_walls(self, symbol: str, current_price: float, 
                                       gamma_data: Dict) -> Optional[Dict]:
@@ -222,7 +303,7 @@ class ODTEGammaMonitor:
             # Sort by distance (closest first)
             proximity_alerts.sort(key=lambda x: abs(x['distance_pct']))
             
-            self.stats['proximity_matches'] += 1
+            self._bump_stat('proximity_matches')
             
             return {
                 'symbol': symbol,
@@ -246,8 +327,6 @@ class ODTEGammaMonitor:
             return False
         
         try:
-            import requests
-            
             symbol = alert_data['symbol']
             current_price = alert_data['current_price']
             proximity_levels = alert_data['proximity_levels']
@@ -409,17 +488,17 @@ class ODTEGammaMonitor:
             
             # Send to Discord
             payload = {'embeds': [embed]}
-            response = requests.post(self.discord_webhook, json=payload, timeout=10)
+            response = self.http.post(self.discord_webhook, json=payload, timeout=10)
             response.raise_for_status()
             
             self.logger.info(f"✅ 0DTE alert sent: {symbol} at ${closest['strike']:.2f} ({closest['distance_pct']:.1f}%)")
-            self.stats['alerts_sent'] += 1
+            self._bump_stat('alerts_sent')
             
             return True
             
         except Exception as e:
             self.logger.error(f"Error sending 0DTE alert: {str(e)}")
-            self.stats['errors'] += 1
+            self._bump_stat('errors')
             return False
     
     def check_pin_alert(self, symbol: str, current_price: float, 
@@ -431,7 +510,6 @@ class ODTEGammaMonitor:
             True if alert sent
         """
         try:
-            import requests
             from datetime import date
             
             # Get expiration date
@@ -512,8 +590,6 @@ class ODTEGammaMonitor:
     def _send_pin_alert(self, symbol: str, pin_result: Dict, alert_type: str) -> bool:
         """Send pin probability alert to Discord"""
         try:
-            import requests
-            
             pin_pct = pin_result['pin_probability']['percent']
             max_pain = pin_result['max_pain']
             current_price = pin_result['current_price']
@@ -636,7 +712,7 @@ class ODTEGammaMonitor:
             
             # Send to Discord
             payload = {'embeds': [embed]}
-            response = requests.post(self.discord_webhook, json=payload, timeout=10)
+            response = self.http.post(self.discord_webhook, json=payload, timeout=10)
             response.raise_for_status()
             
             self.logger.info(f"✅ Pin alert sent: {symbol} ${max_pain:.2f} ({pin_pct:.0f}%) - {alert_type}")
@@ -647,6 +723,47 @@ class ODTEGammaMonitor:
             self.logger.error(f"Error sending pin alert: {str(e)}")
             return False
     
+    def _prefetch_quotes(self, symbols: List[str]) -> Dict[str, float]:
+        """Prices for the whole watchlist from one snapshot request ({} on failure)"""
+        try:
+            return self.analyzer.get_snapshot_prices(symbols)
+        except Exception as e:
+            self.logger.error(f"Error prefetching quotes: {str(e)}")
+            return {}
+    
+    def _process_symbol(self, symbol: str, current_price: Optional[float] = None) -> Optional[tuple]:
+        """
+        Fetch and evaluate one symbol (runs on the scan pool)
+        
+        Returns:
+            (alert_data, gamma_data, options_data) if price is near a 0DTE gamma wall, None otherwise
+        """
+        self._bump_stat('symbols_checked')
+        
+        try:
+            # Check if 0DTE exists
+            odte_exists, gamma_data, current_price = self.check_odte_exists(symbol, current_price)
+            
+            if not odte_exists:
+                return None
+            
+            # Check proximity to gamma walls
+            alert_data = self.check_proximity_to_gamma_walls(symbol, current_price, gamma_data)
+            
+            if not alert_data:
+                return None
+            
+            # Options chain for the pin probability check, fetched here so it
+            # overlaps with the other symbols' requests
+            options_data = self.analyzer.get_options_chain(symbol)
+            
+            return alert_data, gamma_data, options_data
+            
+        except Exception as e:
+            self.logger.error(f"Error processing 0DTE check for {symbol}: {str(e)}")
+            self._bump_stat('errors')
+            return None
+    
     def run_single_check(self) -> int:
         """
         Run single check of all watchlist symbols
@@ -682,31 +799,22 @@ class ODTEGammaMonitor:
         
         alerts_sent = 0
         
-        for symbol in symbols:
-            # Skip if already alerted today
-            #if symbol in self.alerted_today:
-               # self.logger.debug(f"{symbol}: Already alerted today")
-                #continue
-            
-            self.stats['symbols_checked'] += 1
-            
-            # Check if 0DTE exists
-            odte_exists, gamma_data = self.check_odte_exists(symbol)
-            
-            if not odte_exists:
+        # Skip if already alerted today
+        #symbols = [symbol for symbol in symbols if symbol not in self.alerted_today]
+        
+        # One snapshot request prices the watchlist; symbols it misses fall
+        # back to their own quote request
+        quotes = self._prefetch_quotes(symbols)
+        
+        # Symbols are fetched concurrently; alerts are sent from this thread in
+        # watchlist order so Discord posts stay serialized
+        prices = [quotes.get(symbol) for symbol in symbols]
+        for result in self._scan_pool.map(self._process_symbol, symbols, prices):
+            if result is None:
                 continue
             
-            # Get current price
-            current_price = gamma_data.get('gamma_levels', [{}])[0].get('strike', 0)
-            if not current_price:
-                quote = self.analyzer.get_real_time_quote(symbol)
-                current_price = quote['price']
-            
-            # Check proximity to gamma walls
-            alert_data = self.check_proximity_to_gamma_walls(symbol, current_price, gamma_data)
-            
-            if not alert_data:
-                continue
+            alert_data, gamma_data, options_data = result
+            symbol = alert_data['symbol']
             
             # Send gamma wall proximity alert
             success = self.send_alert(alert_data)
@@ -717,14 +825,10 @@ class ODTEGammaMonitor:
             
             # ADDITIONAL: Check pin probability alert (AGGRESSIVE)
             # Uses same options data, no extra API calls
-            options_data = self.analyzer.get_options_chain(symbol)
             if options_data:
-                pin_alert_sent = self.check_pin_alert(symbol, current_price, options_data, gamma_data)
+                pin_alert_sent = self.check_pin_alert(symbol, alert_data['current_price'], options_data, gamma_data)
                 if pin_alert_sent:
                     alerts_sent += 1
-            
-            # Small delay between symbols
-            time.sleep(0.5)
         
         if alerts_sent > 0:
             self.logger.info(f"✅ 0DTE check complete: {alerts_sent} alerts sent")
@@ -743,22 +847,40 @@ class ODTEGammaMonitor:
         self.logger.info(f"   📏 Proximity: {self.min_proximity_pct}%-{self.max_proximity_pct}%")
         self.logger.info(f"   ⏱️ Alert window: {self.alert_window_minutes} minutes")
         
+        self._stop_event.clear()
         try:
-            while True:
+            while not self._stop_event.is_set():
                 try:
                     self.run_single_check()
                 except Exception as e:
                     self.logger.error(f"Error in check cycle: {str(e)}")
                     import traceback
                     self.logger.debug(traceback.format_exc())
-                    self.stats['errors'] += 1
+                    self._bump_stat('errors')
                 
                 # Check every 60 seconds
-                time.sleep(60)
+                self._stop_event.wait(60)
                 
         except KeyboardInterrupt:
             self.logger.info("Stopping 0DTE monitor...")
             self.print_stats()
+        finally:
+            self.shutdown()
+    
+    def stop(self):
+        """Stop the continuous loop without waiting out the current sleep"""
+        self._stop_event.set()
+        self.logger.info("0DTE Gamma Monitor stopped")
+    
+    def shutdown(self):
+        """Stop monitoring, then release pooled connections and workers"""
+        self._stop_event.set()
+        self._scan_pool.shutdown(wait=True)
+        self.http.close()
+        # Shared with other monitors; its session closes with the last holder
+        if self._analyzer_held:
+            self._analyzer_held = False
+            release_shared_analyzer(self.analyzer)
     
     def print_stats(self):
         """Print monitor statistics"""
@@ -824,6 +946,7 @@ def main():
     alerts_sent = monitor.run_single_check()
     print(f"\n✅ Check complete: {alerts_sent} alerts sent")
     monitor.print_stats()
+    monitor.shutdown()
 
 
 if __name__ == '__main__':
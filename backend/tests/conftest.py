@@ -0,0 +1,10 @@
+"""
+backend/tests/conftest.py
+Puts backend/ on sys.path so tests import modules the way the monitors do
+"""
+
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
@@ -0,0 +1,178 @@
+"""
+backend/tests/test_momentum_signal_monitor.py
+Momentum Signal Monitor: trigger prescreen, persisted cooldowns, Discord batching
+"""
+
+import random
+
+import pytest
+
+from monitors.momentum_signal_monitor import MomentumSignalMonitor, SymbolFeatures
+
+
+class FakeAlerter:
+    """Discord alerter stand-in recording each webhook payload"""
+    
+    def __init__(self, accept=True):
+        self.accept = accept
+        self.payloads = []
+    
+    def send_webhook(self, channel, payload):
+        self.payloads.append(payload)
+        return self.accept
+
+
+def make_monitor(tmp_path, alerter=None):
+    config = {'momentum_signal_monitor': {'alert_state_db': str(tmp_path / 'momentum_alerts.db')}}
+    return MomentumSignalMonitor('test-key', discord_alerter=alerter, config=config)
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    monitor = make_monitor(tmp_path, FakeAlerter())
+    yield monitor
+    monitor.shutdown()
+
+
+def random_signal(rng):
+    """Analyzer signal with every trigger input drawn at random (sections sometimes missing)"""
+    r = rng.random
+    signal = {
+        'current_price': r() * 200,
+        'dark_pool_details': {
+            'institutional_flow': rng.choice(['BUYING', 'SELLING', 'NEUTRAL', 'MIXED']),
+            'signal_strength': rng.randint(0, 5),
+            'block_trade_value': r() * 3e6
+        },
+        'volume_analysis': {
+            'rvol': {'rvol': r() * 5, 'classification': 'HIGH'},
+            'volume_spike': {'spike_detected': r() < 0.5, 'spike_ratio': r() * 5}
+        },
+        'open_interest': {},
+        'key_levels': {
+            'at_support': r() < 0.5,
+            'at_resistance': r() < 0.5,
+            'confluence_score': rng.randint(0, 10)
+        },
+        'news': {'sentiment': rng.choice(['POSITIVE', 'VERY POSITIVE', 'NEGATIVE', 'VERY NEGATIVE', 'NEUTRAL'])}
+    }
+    if r() < 0.8:
+        signal['vwap'] = r() * 200
+    if r() < 0.8:
+        signal['open_interest']['nearest_wall'] = {
+            'type': rng.choice(['support', 'resistance', 'call']),
+            'strike': 100,
+            'distance_pct': r() * 2
+        }
+    return signal
+
+
+def test_prescreen_never_skips_a_trigger_that_would_fire(monitor):
+    rng = random.Random(7)
+    signals = [random_signal(rng) for _ in range(5000)]
+    features = [SymbolFeatures.of(signal) for signal in signals]
+    checkers = {alert_type: checker for checker, _, alert_type, _, _, _ in monitor._triggers}
+    
+    skipped = fired = 0
+    for signal, feat, skip in zip(signals, features, monitor._prescreen(features)):
+        for alert_type in skip:
+            result = checkers[alert_type]('TEST', signal, feat)
+            assert not any(result if isinstance(result, tuple) else (result,)), (alert_type, signal)
+            skipped += 1
+        for alert_type in set(checkers) - skip - {'dark_pool_flip', 'confluence_alert'}:
+            result = checkers[alert_type]('TEST', signal, feat)
+            fired += any(result if isinstance(result, tuple) else (result,))
+    
+    # Both sides exercised: plenty of skips, and triggers that did fire weren't skipped
+    assert skipped > 1000
+    assert fired > 100
+
+
+def test_prescreen_matches_checkers_on_precomputed_features(monitor):
+    signal = random_signal(random.Random(3))
+    feat = SymbolFeatures.of(signal)
+    assert monitor.check_momentum_signals('TEST', signal, feat) == monitor.check_momentum_signals('TEST', signal)
+    assert monitor.check_extreme_setup('TEST', signal, feat) == monitor.check_extreme_setup('TEST', signal)
+
+
+def test_features_leave_the_analyzer_signal_untouched():
+    signal = random_signal(random.Random(5))
+    before = repr(signal)
+    SymbolFeatures.of(signal)
+    assert repr(signal) == before
+
+
+def test_cooldowns_survive_restart(tmp_path):
+    monitor = make_monitor(tmp_path, FakeAlerter())
+    assert monitor.send_discord_alert({'title': 'AAA'}, 'AAA', 'momentum_signal')
+    monitor.drain_alerts()
+    monitor.shutdown()
+    
+    restarted = make_monitor(tmp_path, FakeAlerter())
+    try:
+        assert not restarted.can_alert('AAA', 'momentum_signal')
+        assert restarted.can_alert('AAA', 'gamma_approach')
+        assert restarted.daily_alerts == {'AAA': 1}
+    finally:
+        restarted.shutdown()
+
+
+def test_rejected_alert_gives_back_its_cooldown(tmp_path):
+    monitor = make_monitor(tmp_path, FakeAlerter(accept=False))
+    assert monitor.send_discord_alert({'title': 'BBB'}, 'BBB', 'gamma_approach')
+    assert not monitor.can_alert('BBB', 'gamma_approach')  # Held while queued
+    monitor.drain_alerts()
+    assert monitor.can_alert('BBB', 'gamma_approach')
+    monitor.shutdown()
+    
+    restarted = make_monitor(tmp_path, FakeAlerter())
+    try:
+        assert restarted.can_alert('BBB', 'gamma_approach')
+        assert restarted.daily_alerts == {}
+    finally:
+        restarted.shutdown()
+
+
+def test_expired_cooldowns_are_not_restored(tmp_path):
+    monitor = make_monitor(tmp_path, FakeAlerter())
+    monitor.send_discord_alert({'title': 'CCC'}, 'CCC', 'dark_pool_flip')
+    monitor.drain_alerts()
+    monitor._alert_db.execute("UPDATE last_alert SET ts = ts - 3600")
+    monitor._alert_db.commit()
+    monitor.shutdown()
+    
+    restarted = make_monitor(tmp_path, FakeAlerter())
+    try:
+        assert restarted.can_alert('CCC', 'dark_pool_flip')
+    finally:
+        restarted.shutdown()
+
+
+def test_embed_batches_respect_discord_limits(monitor):
+    batches = []
+    monitor._post_embeds = lambda embeds: batches.append(embeds) or True
+    
+    embeds = [
+        {'title': f'large {i}', 'fields': [{'name': 'Why', 'value': 'x' * 1490}]} for i in range(7)
+    ] + [{'title': f'small {i}'} for i in range(25)]
+    for embed in embeds:
+        monitor.send_discord_alert(embed)
+    monitor.drain_alerts()
+    
+    assert [embed for batch in batches for embed in batch] == embeds
+    for batch in batches:
+        assert len(batch) <= 10
+        assert sum(monitor._embed_length(embed) for embed in batch) <= 6000
+    assert monitor.stats['total_alerts_sent'] == len(embeds)
+
+
+def test_embed_length_counts_discord_limited_text():
+    embed = {
+        'title': 'abc',
+        'description': 'de',
+        'footer': {'text': 'f'},
+        'author': {'name': 'gh'},
+        'fields': [{'name': 'i', 'value': 'jk'}],
+        'color': 0xff0000
+    }
+    assert MomentumSignalMonitor._embed_length(embed) == 11